@@ -0,0 +1,45 @@
+"""Wavetable tone kernels: a Numba loop when numba is installed, the NumPy version otherwise.
+
+fill_wavetable(out, lut, slope, step) writes int16 samples of a tone advancing `step` table
+entries per sample into `out`. `lut` holds one period plus a guard sample,
+`slope[i] == lut[i + 1] - lut[i]`, and the table size must be a power of two.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+try:
+    from numba import njit  # type: ignore
+
+    _HAS_NUMBA = True
+except Exception:
+    _HAS_NUMBA = False
+
+
+def _fill_wavetable_numpy(out: np.ndarray, lut: np.ndarray, slope: np.ndarray, step: float) -> None:
+    phase = np.arange(out.shape[0], dtype=np.float64)
+    phase *= step
+    idx = phase.astype(np.intp)
+    phase -= idx  # fractional part, in place
+    idx &= slope.shape[0] - 1
+    acc = slope[idx]
+    acc *= phase
+    acc += lut[idx]
+    out[:] = acc
+
+
+if _HAS_NUMBA:
+
+    @njit(cache=True, fastmath=True, boundscheck=False)
+    def _fill_wavetable_numba(out, lut, slope, step):  # pragma: no cover - needs numba
+        mask = slope.shape[0] - 1
+        for i in range(out.shape[0]):
+            phase = i * step
+            k = int(phase)
+            j = k & mask
+            out[i] = int(lut[j] + slope[j] * (phase - k))
+
+    fill_wavetable = _fill_wavetable_numba
+else:
+    fill_wavetable = _fill_wavetable_numpy
@@ -1,10 +1,14 @@
 from __future__ import annotations
 
-import time
-from typing import List
+import atexit
+import threading
+from functools import lru_cache
+from typing import Callable, Dict, Optional, Tuple
 
 import numpy as np
 
+from core._audio_kernels import fill_wavetable
+
 try:
     import sounddevice as sd  # type: ignore
 
@@ -14,46 +18,144 @@ except Exception:
 
 DEFAULT_SAMPLE_RATE = 44100
 
+# (frequencies, durations, gaps) per notification type; unknown types fall back to "low_beep".
+NOTIFICATION_SEQUENCES: Dict[str, Tuple[Tuple[int, ...], Tuple[int, ...], Tuple[int, ...]]] = {
+    "start_sequence": ((800, 1000, 1200), (180, 180, 180), (80, 80)),
+    "end_sequence": ((900, 700, 500), (200, 200, 400), (150, 250)),
+    "high_beep": ((1000,), (300,), ()),
+    "low_beep": ((500,), (300,), ()),
+}
+
+
+# One sine period at output amplitude (0.8 full scale, int16 units); the size is a power of two
+# so index wrap is a bitwise AND. The extra guard sample (== first sample) lets linear
+# interpolation read idx + 1 without wrapping.
+SINE_LUT_SIZE = 1024
+_SINE_LUT = (np.sin(2 * np.pi * np.arange(SINE_LUT_SIZE + 1) / SINE_LUT_SIZE) * (0.8 * 32767)).astype(np.float32)
+# Per-entry slope (LUT[i + 1] - LUT[i]) so interpolation needs a single extra gather.
+_SINE_SLOPE = np.diff(_SINE_LUT)
+
 
+@lru_cache(maxsize=64)
 def generate_sine_wave(freq_hz: float, duration_ms: int, sample_rate: int = DEFAULT_SAMPLE_RATE) -> np.ndarray:
-    duration_s = duration_ms / 1000.0
-    t = np.linspace(0, duration_s, int(sample_rate * duration_s), False)
-    tone = np.sin(freq_hz * t * 2 * np.pi)
-    return (tone * 0.8).astype(np.float32)
+    """Return a cached, read-only int16 tone synthesized from the shared sine wavetable."""
+    n = int(sample_rate * (duration_ms / 1000.0))
+    wave = np.empty(n, dtype=np.int16)
+    fill_wavetable(wave, _SINE_LUT, _SINE_SLOPE, SINE_LUT_SIZE * freq_hz / sample_rate)
+    wave.flags.writeable = False
+    return wave
+
+
+@lru_cache(maxsize=None)
+def _notification_wave(sound_type: str, sample_rate: int = DEFAULT_SAMPLE_RATE) -> np.ndarray:
+    """Render a whole notification sequence (tones plus silent gaps) into one read-only buffer."""
+    freqs, durs, gaps = NOTIFICATION_SEQUENCES[sound_type]
+    parts = []
+    for i, (f, d) in enumerate(zip(freqs, durs)):
+        parts.append(generate_sine_wave(f, d, sample_rate))
+        if i < len(gaps):
+            parts.append(np.zeros(int(sample_rate * gaps[i] / 1000), dtype=np.int16))
+    wave = np.concatenate(parts)
+    wave.flags.writeable = False
+    return wave
+
+
+def _prewarm_notification_tones() -> None:
+    for sound_type in NOTIFICATION_SEQUENCES:
+        _notification_wave(sound_type)
+
+
+class _ToneStream:
+    """Keep one low-latency int16 output stream open; play() swaps in a new buffer.
+
+    Like sd.play, a new wave replaces whatever is still sounding, but the PortAudio
+    stream is opened once instead of per call.
+    """
+
+    def __init__(self, sample_rate: int) -> None:
+        self._lock = threading.Lock()
+        self._wave: Optional[np.ndarray] = None
+        self._pos = 0
+        self._stream = sd.OutputStream(
+            samplerate=sample_rate,
+            channels=1,
+            dtype="int16",
+            blocksize=256,
+            latency="low",
+            callback=self._callback,
+        )
+        self._stream.start()
+
+    def play(self, wave: np.ndarray) -> None:
+        with self._lock:
+            self._wave = wave
+            self._pos = 0
+
+    def close(self) -> None:
+        self._stream.close()
+
+    def _callback(self, outdata, frames, time_info, status) -> None:  # pragma: no cover - audio thread
+        with self._lock:
+            wave = self._wave
+            if wave is None:
+                outdata.fill(0)
+                return
+            chunk = wave[self._pos : self._pos + frames]
+            n = len(chunk)
+            outdata[:n, 0] = chunk
+            outdata[n:] = 0
+            self._pos += n
+            if self._pos >= len(wave):
+                self._wave = None
+
+
+def _open_tone_stream() -> Optional[_ToneStream]:
+    if not _HAS_SOUNDDEVICE:
+        return None
+    try:
+        stream = _ToneStream(DEFAULT_SAMPLE_RATE)
+    except Exception:
+        return None
+    atexit.register(stream.close)
+    return stream
 
 
 def play_wave(wave: np.ndarray, sample_rate: int = DEFAULT_SAMPLE_RATE) -> None:
     if not _HAS_SOUNDDEVICE:
         return
     try:
-        sd.play(wave, samplerate=sample_rate, blocking=False)
+        if _stream is not None and sample_rate == DEFAULT_SAMPLE_RATE:
+            _stream.play(wave)
+        else:
+            sd.play(wave, samplerate=sample_rate, blocking=False)
     except Exception:
         pass
 
 
 def play_beep(frequency_hz: float, duration_ms: int) -> None:
-    wave = generate_sine_wave(frequency_hz, duration_ms)
-    play_wave(wave)
+    play_wave(generate_sine_wave(frequency_hz, duration_ms))
 
 
 def play_notification_sound(sound_type: str) -> None:
-    if sound_type == "start_sequence":
-        freqs: List[int] = [800, 1000, 1200]
-        durs: List[int] = [180, 180, 180]
-        gaps: List[int] = [80, 80]
-    elif sound_type == "end_sequence":
-        freqs = [900, 700, 500]
-        durs = [200, 200, 400]
-        gaps = [150, 250]
-    elif sound_type == "high_beep":
-        freqs = [1000]
-        durs = [300]
-        gaps = []
-    else:
-        freqs = [500]
-        durs = [300]
-        gaps = []
-    for i, (f, d) in enumerate(zip(freqs, durs)):
-        play_beep(f, d)
-        if i < len(gaps):
-            time.sleep(gaps[i] / 1000.0)
+    """Start a notification sequence and return immediately; gaps are rendered as silence."""
+    if sound_type not in NOTIFICATION_SEQUENCES:
+        sound_type = "low_beep"
+    play_wave(_notification_wave(sound_type))
+
+
+def preload_notification(sound_type: str) -> Optional[Callable[[], None]]:
+    """Return a callable that starts a pre-rendered sequence on the open tone stream.
+
+    Calling it only swaps a buffer, so it is safe on the GUI thread. Returns None when no
+    persistent stream is open (playback would have to open the device each time).
+    """
+    if _stream is None:
+        return None
+    if sound_type not in NOTIFICATION_SEQUENCES:
+        sound_type = "low_beep"
+    stream, wave = _stream, _notification_wave(sound_type)
+    return lambda: stream.play(wave)
+
+
+_prewarm_notification_tones()
+_stream = _open_tone_stream()
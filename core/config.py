@@ -1,13 +1,25 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field, fields
 from pathlib import Path
-from typing import Dict
+from types import MappingProxyType
+from typing import Dict, Mapping
 
 
 DEFAULT_AUTHOR = "mojack"
 RHYTHM_VERSION = "v1.0.0"
 
+# Shared, read-only default part durations; gather_config replaces them with a fresh dict.
+DEFAULT_PART_DURATIONS_S: Mapping[str, float] = MappingProxyType(
+    {
+        "rest_pre": 5.0,
+        "cued_movement": 15.0,
+        "rest_instruction": 5.0,
+        "internal_movement": 15.0,
+        "rest_post": 5.0,
+    }
+)
+
 
 @dataclass
 class ParameterState:
@@ -24,14 +36,16 @@ class ParameterState:
     visual_radius_px: int
     num_blocks: int
     inter_block_interval_s: float
-    part_durations_s: Dict[str, float] = field(default_factory=dict)
+    part_durations_s: Mapping[str, float] = field(default_factory=dict)
     output_folder: str = ""
     file_prefix: str = "session"
     notes: str = ""
 
-    def to_dict(self) -> dict:
-        data = asdict(self)
-        data["part_durations_s"] = dict(self.part_durations_s)
+    def to_dict(self) -> Dict[str, object]:
+        """Return a shallow dict of all fields; part_durations_s is always a plain (picklable) dict."""
+        data = {f.name: getattr(self, f.name) for f in fields(self)}
+        durations = self.part_durations_s
+        data["part_durations_s"] = durations if type(durations) is dict else dict(durations)
         return data
 
     @classmethod
@@ -50,13 +64,7 @@ class ParameterState:
             visual_radius_px=160,
             num_blocks=2,
             inter_block_interval_s=5.0,
-            part_durations_s={
-                "rest_pre": 5.0,
-                "cued_movement": 15.0,
-                "rest_instruction": 5.0,
-                "internal_movement": 15.0,
-                "rest_post": 5.0,
-            },
+            part_durations_s=DEFAULT_PART_DURATIONS_S,
             output_folder=str(Path.cwd()),
             file_prefix="session",
             notes="",
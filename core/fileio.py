@@ -1,12 +1,30 @@
 from __future__ import annotations
 
+import gzip
+import os
 import pickle
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Union
+from typing import BinaryIO, Union
+
+import numpy as np
+
+try:
+    import lz4.frame as lz4_frame  # type: ignore
+
+    HAS_LZ4 = True
+except Exception:
+    lz4_frame = None
+    HAS_LZ4 = False
 
 
 PathLike = Union[str, Path]
+IO_BUFFER_SIZE = 1 << 20
+LZ4_SUFFIX = ".lz4"
+GZIP_SUFFIX = ".gz"
+# Suffixes written as a compressed pickle stream (never as npz).
+COMPRESSED_SUFFIXES = (LZ4_SUFFIX, GZIP_SUFFIX)
 
 
 def ensure_directory(path: PathLike) -> Path:
@@ -24,13 +42,55 @@ def timestamp_string(dt: datetime | None = None, fmt: str = "%Y%m%d_%H%M%S") ->
     return dt.strftime(fmt)
 
 
+@lru_cache(maxsize=32)
+def _cached_ensure(folder_str: str) -> Path:
+    """ensure_directory, run once per folder string."""
+    return ensure_directory(folder_str)
+
+
 def build_timestamped_path(folder: PathLike, prefix: str, dt: datetime | None = None, suffix: str = "pkl") -> Path:
-    folder_path = ensure_directory(folder)
+    folder_str = os.fspath(folder) if folder else "."
+    folder_path = _cached_ensure(folder_str)
+    if not folder_path.is_dir():  # removed after it was cached
+        _cached_ensure.cache_clear()
+        folder_path = _cached_ensure(folder_str)
     suffix = suffix.lstrip(".")
     ts = timestamp_string(dt)
-    return folder_path / f"{prefix}_{ts}.{suffix}"
+    return folder_path.joinpath(f"{prefix}_{ts}.{suffix}")
+
+
+def _is_array_dict(data: object) -> bool:
+    return isinstance(data, dict) and bool(data) and all(
+        isinstance(k, str) and isinstance(v, np.ndarray) and not v.dtype.hasobject for k, v in data.items()
+    )
+
+
+def open_binary(path: PathLike, mode: str = "rb") -> BinaryIO:
+    """Open a file for pickle I/O; paths ending in .lz4 or .gz are read/written compressed."""
+    path = Path(path)
+    if path.suffix == GZIP_SUFFIX:
+        if "w" in mode:
+            return gzip.open(path, mode, compresslevel=1)
+        return gzip.open(path, mode)
+    if path.suffix == LZ4_SUFFIX:
+        if lz4_frame is None:
+            raise RuntimeError("The 'lz4' package is required for .lz4 files.")
+        if "w" in mode:
+            return lz4_frame.open(str(path), mode, compression_level=1)
+        return lz4_frame.open(str(path), mode)
+    return open(path, mode, buffering=IO_BUFFER_SIZE)
 
 
 def save_pickle(data: object, path: PathLike) -> None:
-    with open(Path(path), "wb") as f:
-        pickle.dump(data, f)
+    """Write data with pickle protocol 5 (the highest); a dict of non-object arrays is stored as a compressed npz.
+
+    A path ending in .lz4 or .gz always gets a compressed pickle. pickletools.optimize is deliberately
+    not applied: it is slow and saves next to nothing on protocol-5 output. core.utils.load_pickle
+    reads every form back.
+    """
+    path = Path(path)
+    with open_binary(path, "wb") as f:
+        if path.suffix not in COMPRESSED_SUFFIXES and _is_array_dict(data):
+            np.savez_compressed(f, **data)
+        else:
+            pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
@@ -1,21 +1,38 @@
 from __future__ import annotations
 
 import random
-from typing import Dict, List
+from functools import lru_cache
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+
+_rng = np.random.default_rng()
+
+# One record per scheduled trial; the runner logs results into its own per-block array.
+TRIAL_DTYPE = np.dtype([("digit", "i1"), ("is_go", "?")])
+
+WeightItems = Tuple[Tuple[int, float], ...]
 
 
 def weighted_sample(candidates: List[int], weights: List[float]) -> int:
     return random.choices(candidates, weights=weights, k=1)[0]
 
 
-def normalize_weights(weights: List[float]) -> List[float]:
-    total = sum(weights)
+def normalize_weights(weights: Sequence[float] | np.ndarray) -> np.ndarray:
+    arr = np.asarray(weights, dtype=np.float64)
+    total = arr.sum()
     if total <= 0:
-        return [0.0 for _ in weights]
-    return [w / total for w in weights]
+        return np.zeros_like(arr)
+    return arr / total
 
 
-def compute_go_ratio(go_digits: List[int], nogo_digits: List[int], digit_weights: Dict[int, float]) -> float:
+def _freeze_weights(digit_weights: Dict[int, float]) -> WeightItems:
+    return tuple(sorted(digit_weights.items()))
+
+
+@lru_cache(maxsize=32)
+def _go_ratio(go_digits: Tuple[int, ...], nogo_digits: Tuple[int, ...], weight_items: WeightItems) -> float:
+    digit_weights = dict(weight_items)
     total_go = sum(max(digit_weights.get(d, 0.0), 0.0) for d in go_digits)
     total_nogo = sum(max(digit_weights.get(d, 0.0), 0.0) for d in nogo_digits)
     if total_go <= 0 or total_nogo <= 0:
@@ -23,13 +40,75 @@ def compute_go_ratio(go_digits: List[int], nogo_digits: List[int], digit_weights
     return total_go / (total_go + total_nogo)
 
 
+def compute_go_ratio(go_digits: List[int], nogo_digits: List[int], digit_weights: Dict[int, float]) -> float:
+    return _go_ratio(tuple(go_digits), tuple(nogo_digits), _freeze_weights(digit_weights))
+
+
+# (candidates, alias-table acceptance probabilities, alias indices)
+DigitPool = Tuple[np.ndarray, np.ndarray, np.ndarray]
+
+
+@lru_cache(maxsize=32)
+def _build_alias(weights: Tuple[float, ...]) -> Tuple[np.ndarray, np.ndarray]:
+    """Build a Walker/Vose alias table so each weighted draw costs O(1)."""
+    n = len(weights)
+    scaled = (normalize_weights(weights) * n).tolist()
+    prob = np.ones(n, dtype=np.float64)
+    alias = np.arange(n, dtype=np.intp)
+    small = [i for i, p in enumerate(scaled) if p < 1.0]
+    large = [i for i, p in enumerate(scaled) if p >= 1.0]
+    while small and large:
+        s, big = small.pop(), large.pop()
+        prob[s] = scaled[s]
+        alias[s] = big
+        scaled[big] += scaled[s] - 1.0
+        (small if scaled[big] < 1.0 else large).append(big)
+    prob.flags.writeable = False
+    alias.flags.writeable = False
+    return prob, alias
+
+
+def _alias_sample(pool: DigitPool, size: int) -> np.ndarray:
+    candidates, prob, alias = pool
+    k = _rng.integers(0, len(prob), size=size)
+    u = _rng.random(size)
+    return candidates[np.where(u < prob[k], k, alias[k])]
+
+
+def _weighted_pool(digits: Tuple[int, ...], digit_weights: Dict[int, float]) -> DigitPool:
+    candidates: List[int] = []
+    weights: List[float] = []
+    for d in digits:
+        w = max(float(digit_weights.get(d, 1.0)), 0.0)
+        if w > 0:
+            candidates.append(d)
+            weights.append(w)
+    cand_arr = np.asarray(candidates, dtype=np.int64)
+    cand_arr.flags.writeable = False
+    return (cand_arr, *_build_alias(tuple(weights)))
+
+
+@lru_cache(maxsize=32)
+def _prepare_pools(
+    go_digits: Tuple[int, ...], nogo_digits: Tuple[int, ...], weight_items: WeightItems
+) -> Tuple[DigitPool, DigitPool]:
+    """Return read-only (go_pool, nogo_pool) alias tables, cached across blocks."""
+    digit_weights = dict(weight_items)
+    go_pool = _weighted_pool(go_digits, digit_weights)
+    nogo_pool = _weighted_pool(nogo_digits, digit_weights)
+    if not len(go_pool[0]) or not len(nogo_pool[0]):
+        raise ValueError("Non-zero weights are required for Go and No-Go digits.")
+    return go_pool, nogo_pool
+
+
 def generate_trial_schedule(
     go_digits: List[int],
     nogo_digits: List[int],
     digit_weights: Dict[int, float],
     go_ratio: float,
     n_trials_per_block: int,
-) -> List[Dict[str, object]]:
+) -> np.ndarray:
+    """Return a shuffled TRIAL_DTYPE array for one block (index it like a list of trial dicts)."""
     overlap = set(go_digits) & set(nogo_digits)
     if overlap:
         raise ValueError("Digits cannot be both Go and No-Go: {}".format(sorted(overlap)))
@@ -39,35 +118,18 @@ def generate_trial_schedule(
     n_go = max(0, min(n_go, n_trials_per_block))
     n_nogo = n_trials_per_block - n_go
 
-    go_candidates: List[int] = []
-    go_weights: List[float] = []
-    for d in go_digits:
-        w = max(float(digit_weights.get(d, 1.0)), 0.0)
-        if w > 0:
-            go_candidates.append(d)
-            go_weights.append(w)
+    go_pool, nogo_pool = _prepare_pools(tuple(go_digits), tuple(nogo_digits), _freeze_weights(digit_weights))
 
-    nogo_candidates: List[int] = []
-    nogo_weights: List[float] = []
-    for d in nogo_digits:
-        w = max(float(digit_weights.get(d, 1.0)), 0.0)
-        if w > 0:
-            nogo_candidates.append(d)
-            nogo_weights.append(w)
+    trials = np.zeros(n_trials_per_block, dtype=TRIAL_DTYPE)
+    trials["digit"][:n_go] = _alias_sample(go_pool, n_go)
+    trials["digit"][n_go:] = _alias_sample(nogo_pool, n_nogo)
+    trials["is_go"][:n_go] = True
 
-    if not go_candidates or not nogo_candidates:
-        raise ValueError("Non-zero weights are required for Go and No-Go digits.")
-
-    go_weights = normalize_weights(go_weights)
-    nogo_weights = normalize_weights(nogo_weights)
+    _rng.shuffle(trials)
+    return trials
 
-    trials: List[Dict[str, object]] = []
-    for _ in range(n_go):
-        digit = weighted_sample(go_candidates, go_weights)
-        trials.append({"digit": digit, "is_go": True})
-    for _ in range(n_nogo):
-        digit = weighted_sample(nogo_candidates, nogo_weights)
-        trials.append({"digit": digit, "is_go": False})
 
-    random.shuffle(trials)
-    return trials
+def trials_to_dicts(trials: np.ndarray) -> List[Dict[str, object]]:
+    """Convert a TRIAL_DTYPE array into plain per-trial dicts for code that expects them."""
+    names = trials.dtype.names
+    return [dict(zip(names, row)) for row in trials.tolist()]
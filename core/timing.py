@@ -1,10 +1,12 @@
 from __future__ import annotations
 
 import math
+import threading
 import time
 from dataclasses import dataclass, field
-from datetime import datetime
-from typing import Callable, Optional, Tuple
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Any, Callable, Generator, Optional, Tuple
 
 from PyQt5 import QtCore
 
@@ -13,10 +15,16 @@ from PyQt5 import QtCore
 class Stopwatch:
     start_datetime: datetime = field(default_factory=datetime.now)
     start_perf: float = field(default_factory=time.perf_counter)
+    start_ns: int = field(init=False)
+
+    def __post_init__(self) -> None:
+        # perf_counter_ns reads the same clock as perf_counter.
+        self.start_ns = round(self.start_perf * 1e9)
 
     def reset(self) -> None:
         self.start_datetime = datetime.now()
         self.start_perf = time.perf_counter()
+        self.start_ns = round(self.start_perf * 1e9)
 
     def elapsed(self) -> float:
         return time.perf_counter() - self.start_perf
@@ -24,8 +32,26 @@ class Stopwatch:
     def elapsed_ms(self) -> int:
         return int(self.elapsed() * 1000)
 
+    def elapsed_ns(self) -> int:
+        return time.perf_counter_ns() - self.start_ns
+
     def timestamp_pair(self) -> Tuple[datetime, float]:
-        return datetime.now(), self.elapsed()
+        """Return (wall-clock time, seconds elapsed) from a single perf_counter read.
+
+        The wall-clock time is derived from the start_datetime/start_perf anchor.
+        """
+        elapsed = time.perf_counter() - self.start_perf
+        return self.start_datetime + timedelta(seconds=elapsed), elapsed
+
+    def timestamp_pair_ns(self) -> Tuple[datetime, int]:
+        """Like timestamp_pair, with the elapsed time as integer nanoseconds (no float arithmetic)."""
+        elapsed_ns = time.perf_counter_ns() - self.start_ns
+        return self.start_datetime + timedelta(microseconds=elapsed_ns // 1000), elapsed_ns
+
+
+# Process-wide wall/perf anchor for timestamp_pair_from_perf.
+_EPOCH_WALL = datetime.now()
+_EPOCH_PERF = time.perf_counter()
 
 
 def elapsed_since(start_perf: float) -> float:
@@ -33,7 +59,8 @@ def elapsed_since(start_perf: float) -> float:
 
 
 def timestamp_pair_from_perf(start_perf: float) -> Tuple[datetime, float]:
-    return datetime.now(), elapsed_since(start_perf)
+    now_perf = time.perf_counter()
+    return _EPOCH_WALL + timedelta(seconds=now_perf - _EPOCH_PERF), now_perf - start_perf
 
 
 def start_countdown_timer(
@@ -71,12 +98,68 @@ def start_countdown_timer(
     return timer
 
 
-def format_countdown_text(message: str, remaining_ms: int, use_html: bool = False) -> str:
-    """Return a formatted countdown string; use_html adds monospace styling like GoStop."""
-    countdown_str = f"{remaining_ms/1000:06.3f}s"
+class TimerCoroutine(QtCore.QObject):
+    """Step a generator-based coroutine on the Qt event loop with one reusable single-shot timer.
+
+    The generator yields a delay in milliseconds to sleep, or None to wait until resume() is
+    called. The yield evaluates to None when a sleep runs out, or to the value passed to
+    resume(); resume() during a sleep cuts it short. cancel() closes the generator.
+    """
+
+    def __init__(self, coroutine: Generator[Optional[int], Any, None], parent: Optional[QtCore.QObject] = None):
+        super().__init__(parent)
+        self._coroutine = coroutine
+        self._timer = QtCore.QTimer(self)
+        self._timer.setSingleShot(True)
+        # Every stimulus/response deadline runs through this timer, so skip coarse-timer slack.
+        self._timer.setTimerType(QtCore.Qt.PreciseTimer)
+        self._timer.timeout.connect(self._on_timeout)
+        self.finished = False
+
+    def start(self) -> None:
+        self._advance(None)
+
+    def resume(self, value: Any = None) -> None:
+        self._timer.stop()
+        self._advance(value)
+
+    def cancel(self) -> None:
+        """End the coroutine: GeneratorExit is raised at its current yield, so its finally blocks run."""
+        self._timer.stop()
+        if not self.finished:
+            self.finished = True
+            self._coroutine.close()
+
+    def _on_timeout(self) -> None:
+        self._advance(None)
+
+    def _advance(self, value: Any) -> None:
+        if self.finished:
+            return
+        try:
+            delay_ms = self._coroutine.send(value)
+        except StopIteration:
+            self.finished = True
+            return
+        if delay_ms is not None:
+            self._timer.start(max(0, int(delay_ms)))
+
+
+def countdown_affixes(message: str, use_html: bool = False) -> Tuple[str, str]:
+    """Return the fixed (prefix, suffix) that format_countdown_text puts around the seconds."""
     if use_html:
-        return f"{message}<br><span style='font-family: \"Courier New\", monospace;'>{countdown_str}</span>"
-    return f"{message}\n{countdown_str}"
+        return f"{message}<br><span style='font-family: \"Courier New\", monospace;'>", "</span>"
+    return f"{message}\n", ""
+
+
+@lru_cache(maxsize=4096)
+def format_countdown_text(message: str, remaining_ms: int, use_html: bool = False) -> str:
+    """Return a formatted countdown string; use_html adds monospace styling like GoStop.
+
+    Memoized: countdown ticks repeat the same (message, remaining_ms) pairs block after block.
+    """
+    prefix, suffix = countdown_affixes(message, use_html)
+    return f"{prefix}{remaining_ms/1000:06.3f}s{suffix}"
 
 
 def run_blocking_countdown(
@@ -85,20 +168,40 @@ def run_blocking_countdown(
     on_finished: Optional[Callable[[], None]] = None,
     check_abort: Optional[Callable[[], bool]] = None,
     step_s: float = 0.01,
+    abort_event: Optional[threading.Event] = None,
 ) -> None:
-    """Blocking countdown loop for contexts without Qt timers (keeps updating on_tick)."""
+    """Blocking countdown loop for contexts without Qt timers (keeps updating on_tick).
+
+    Between ticks the thread sleeps until the next step_s boundary (counted back from the end
+    time); setting abort_event wakes it immediately.
+    """
+
+    def _aborted() -> bool:
+        if abort_event is not None and abort_event.is_set():
+            return True
+        return bool(check_abort and check_abort())
+
     end_time = time.perf_counter() + max(0.0, duration_s)
+    step_s = max(step_s, 0.001)
     last_ms = None
     while True:
-        if check_abort and check_abort():
+        if _aborted():
             break
-        now = time.perf_counter()
-        remaining_ms = max(0, int(math.ceil((end_time - now) * 1000)))
+        remaining_s = end_time - time.perf_counter()
+        remaining_ms = max(0, int(math.ceil(remaining_s * 1000)))
         if remaining_ms != last_ms:
             on_tick(remaining_ms)
             last_ms = remaining_ms
-        if now >= end_time:
+        if remaining_s <= 0:
             break
-        time.sleep(step_s)
-    if on_finished and (not check_abort or not check_abort()):
+        timeout = remaining_s % step_s
+        if timeout < 0.0005:
+            timeout += step_s
+        timeout = min(timeout, remaining_s)
+        if abort_event is not None:
+            if abort_event.wait(timeout):
+                break
+        else:
+            time.sleep(timeout)
+    if on_finished and not _aborted():
         on_finished()
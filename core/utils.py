@@ -1,30 +1,71 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Mapping
+from typing import Any, Callable, Dict, Mapping
 
 import pickle
 
+import numpy as np
 from PyQt5 import QtGui, QtWidgets
 
+from core.fileio import COMPRESSED_SUFFIXES, open_binary
 
-def translate(translations: Mapping[str, Mapping[str, str]], language: str, key: str, fallback_language: str = "en") -> str:
-    """Return a localized string from either lang-first or key-first translation maps."""
+
+# Translation maps seen by translate(), keyed by id(); holding a reference keeps each id valid.
+_TRANSLATION_TABLES: Dict[int, Mapping[str, Mapping[str, str]]] = {}
+
+
+@lru_cache(maxsize=8)
+def _flatten(translations_id: int, language: str, fallback_language: str) -> Dict[str, str]:
+    """Resolve one translation map into a flat {key: text} dict for a language."""
+    translations = _TRANSLATION_TABLES[translations_id]
     lang_map = translations.get(language)
     if isinstance(lang_map, Mapping):
-        return lang_map.get(key, key)
+        return dict(lang_map)
 
-    entry = translations.get(key)
-    if isinstance(entry, Mapping):
+    fallback_map = translations.get(fallback_language)
+    flat: Dict[str, str] = dict(fallback_map) if isinstance(fallback_map, Mapping) else {}
+    for key, entry in translations.items():
+        if not isinstance(entry, Mapping):
+            continue
         if language in entry:
-            return entry[language]
-        if fallback_language in entry:
-            return entry[fallback_language]
-        return next(iter(entry.values()), key)
+            flat[key] = entry[language]
+        elif fallback_language in entry:
+            flat[key] = entry[fallback_language]
+        else:
+            flat[key] = next(iter(entry.values()), key)
+    return flat
+
+
+@lru_cache(maxsize=8)
+def _resolver(translations_id: int, language: str, fallback_language: str) -> Callable[[str], str]:
+    def resolve(key: str, _get=_flatten(translations_id, language, fallback_language).get) -> str:
+        return _get(key, key)
+
+    return resolve
 
-    if fallback_language in translations and isinstance(translations[fallback_language], Mapping):
-        return translations[fallback_language].get(key, key)
-    return key
+
+def translate_fast(
+    translations: Mapping[str, Mapping[str, str]], language: str, fallback_language: str = "en"
+) -> Callable[[str], str]:
+    """Return a key -> text resolver pre-bound to one language of a translation map.
+
+    Code that stays in one language can call the resolver directly and skip translate()'s dispatch.
+    """
+    table_id = id(translations)
+    _TRANSLATION_TABLES.setdefault(table_id, translations)
+    return _resolver(table_id, language, fallback_language)
+
+
+def translate(translations: Mapping[str, Mapping[str, str]], language: str, key: str, fallback_language: str = "en") -> str:
+    """Return a localized string from either lang-first or key-first translation maps.
+
+    Each (map, language) pair is flattened once, so a lookup is a single dict access.
+    """
+    table_id = id(translations)
+    _TRANSLATION_TABLES.setdefault(table_id, translations)
+    return _flatten(table_id, language, fallback_language).get(key, key)
 
 
 def get_app_icon(icon_path: Path) -> QtGui.QIcon:
@@ -41,6 +82,14 @@ def set_groupbox_title_font(groupbox: QtWidgets.QGroupBox, point_size: int = 12)
 
 
 def load_pickle(path: str | Path) -> Any:
-    """Load and return the object stored in a pickle file at the given path."""
-    with open(Path(path), "rb") as f:
+    """Load and return the object stored in a pickle file at the given path.
+
+    Files written by save_pickle as npz archives (dicts of arrays) come back as a dict of arrays;
+    .lz4 and .gz paths are decompressed on the fly.
+    """
+    path = Path(path)
+    with open_binary(path, "rb") as f:
+        if path.suffix not in COMPRESSED_SUFFIXES and f.peek(2)[:2] == b"PK":
+            with np.load(f) as archive:
+                return dict(archive)
         return pickle.load(f)
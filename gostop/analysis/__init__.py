@@ -1,5 +1,25 @@
 """Analysis helpers for the Go/No-Go task."""
 
-from .metrics import compute_go_nogo_metrics
+from .metrics import (
+    OUTCOME_COMMISSION,
+    OUTCOME_CORRECT_WITHHOLDING,
+    OUTCOME_HIT,
+    OUTCOME_LABELS,
+    OUTCOME_MISS,
+    OUTCOME_PENDING,
+    TRIAL_LOG_DTYPE,
+    compute_go_nogo_metrics,
+    compute_trial_log_metrics,
+)
 
-__all__ = ["compute_go_nogo_metrics"]
+__all__ = [
+    "OUTCOME_COMMISSION",
+    "OUTCOME_CORRECT_WITHHOLDING",
+    "OUTCOME_HIT",
+    "OUTCOME_LABELS",
+    "OUTCOME_MISS",
+    "OUTCOME_PENDING",
+    "TRIAL_LOG_DTYPE",
+    "compute_go_nogo_metrics",
+    "compute_trial_log_metrics",
+]
@@ -1,7 +1,26 @@
 from __future__ import annotations
 
-from statistics import mean
-from typing import Dict, Iterable, List, Optional
+from collections.abc import Iterable
+from typing import Dict, List, Optional
+
+import numpy as np
+
+# Per-block trial log filled in place by the GoStop runner. Times are integer nanoseconds since
+# experiment start; response_ns is only meaningful for hits and commission errors.
+# trial_index 0 marks a slot that was never reached.
+TRIAL_LOG_DTYPE = np.dtype(
+    [
+        ("trial_index", "i4"),
+        ("digit", "i1"),
+        ("is_go", "?"),
+        ("onset_ns", "i8"),
+        ("response_ns", "i8"),
+        ("outcome", "u1"),
+    ]
+)
+OUTCOME_MISS, OUTCOME_HIT, OUTCOME_COMMISSION, OUTCOME_CORRECT_WITHHOLDING = range(4)
+OUTCOME_PENDING = 255
+OUTCOME_LABELS = ("miss", "hit", "commission_error", "correct_withholding")
 
 
 def _extract_trials(log: Dict) -> List[Dict]:
@@ -9,30 +28,24 @@ def _extract_trials(log: Dict) -> List[Dict]:
     trials: List[Dict] = []
     if isinstance(blocks, dict):
         for block in blocks.values():
-            block_trials = block.get("trials", [])
-            if isinstance(block_trials, Iterable):
-                trials.extend([t for t in block_trials if isinstance(t, dict)])
+            block_trials = block.get("trials", ())
+            if type(block_trials) is list:
+                # Trials are built as plain dicts, so an exact type check covers the common case.
+                trials += [t for t in block_trials if type(t) is dict]
+            elif isinstance(block_trials, Iterable):
+                trials += [t for t in block_trials if isinstance(t, dict)]
     return trials
 
 
-def _compute_rt_seconds(trial: Dict) -> Optional[float]:
-    times = trial.get("times")
-    if not times or len(times) < 2:
-        return None
-    onset, response = times[0], times[1]
-    if onset is None or response is None:
-        return None
-    try:
-        return float(response) - float(onset)
-    except (TypeError, ValueError):
+def _extract_trial_array(log: Dict) -> Optional[np.ndarray]:
+    """Return all trials as one TRIAL_LOG_DTYPE array when every block stores them that way."""
+    blocks = log.get("timing_relative", {}).get("blocks", {})
+    if not isinstance(blocks, dict) or not blocks:
         return None
-
-
-def _safe_mean(values: Iterable[float]) -> Optional[float]:
-    vals = [v for v in values if v is not None]
-    if not vals:
+    arrays = [block.get("trials") for block in blocks.values() if isinstance(block, dict)]
+    if not arrays or not all(isinstance(a, np.ndarray) and a.dtype == TRIAL_LOG_DTYPE for a in arrays):
         return None
-    return mean(vals)
+    return np.concatenate(arrays)
 
 
 def _percent(numerator: int, denominator: int) -> Optional[float]:
@@ -41,6 +54,32 @@ def _percent(numerator: int, denominator: int) -> Optional[float]:
     return (numerator / denominator) * 100.0
 
 
+def _mean_rt_s(rt_ns: np.ndarray) -> Optional[float]:
+    if not rt_ns.size:
+        return None
+    return float(rt_ns.sum()) / rt_ns.size * 1e-9
+
+
+def compute_trial_log_metrics(trials: np.ndarray) -> Dict[str, Optional[float]]:
+    """Same metrics as compute_go_nogo_metrics, straight from TRIAL_LOG_DTYPE records.
+
+    Pass one block's log or several concatenated; unreached slots are ignored.
+    """
+    trials = trials[trials["trial_index"] > 0]
+    go = trials["is_go"]
+    outcome = trials["outcome"]
+    hit = go & (outcome == OUTCOME_HIT)
+    commission = ~go & (outcome == OUTCOME_COMMISSION)
+    rt_ns = trials["response_ns"] - trials["onset_ns"]
+    n_go = int(np.count_nonzero(go))
+    return {
+        "go_hit_percent": _percent(int(np.count_nonzero(hit)), n_go),
+        "nogo_commission_percent": _percent(int(np.count_nonzero(commission)), len(trials) - n_go),
+        "mean_rt_go_hit": _mean_rt_s(rt_ns[hit]),
+        "mean_rt_nogo_commission": _mean_rt_s(rt_ns[commission]),
+    }
+
+
 def compute_go_nogo_metrics(log: Dict) -> Dict[str, Optional[float]]:
     """
     Calculate hit/commission rates and reaction times from the Go/No-Go log structure.
@@ -50,23 +89,41 @@ def compute_go_nogo_metrics(log: Dict) -> Dict[str, Optional[float]]:
     - nogo_commission_percent
     - mean_rt_go_hit (seconds)
     - mean_rt_nogo_commission (seconds)
-    """
-    trials = _extract_trials(log)
-    go_trials = [t for t in trials if t.get("is_go_trial")]
-    nogo_trials = [t for t in trials if not t.get("is_go_trial")]
-
-    go_hits = [t for t in go_trials if t.get("outcome") == "hit"]
-    nogo_commissions = [t for t in nogo_trials if t.get("outcome") == "commission_error"]
 
-    go_hit_percent = _percent(len(go_hits), len(go_trials))
-    nogo_commission_percent = _percent(len(nogo_commissions), len(nogo_trials))
-
-    mean_rt_go_hit = _safe_mean(_compute_rt_seconds(t) for t in go_hits)
-    mean_rt_nogo_commission = _safe_mean(_compute_rt_seconds(t) for t in nogo_commissions)
+    Blocks whose trials are TRIAL_LOG_DTYPE arrays are evaluated with boolean masks;
+    lists of trial dicts use the per-trial loop.
+    """
+    trial_array = _extract_trial_array(log)
+    if trial_array is not None:
+        return compute_trial_log_metrics(trial_array)
+
+    n_go = n_nogo = n_hit = n_comm = 0
+    rt_hit_sum = rt_comm_sum = 0.0
+    rt_hit_n = rt_comm_n = 0
+    for t in _extract_trials(log):
+        outcome = t.get("outcome")
+        times = t.get("times")
+        rt = None
+        if times and len(times) >= 2 and times[0] is not None and times[1] is not None:
+            rt = times[1] - times[0]
+        if t.get("is_go_trial"):
+            n_go += 1
+            if outcome == "hit":
+                n_hit += 1
+                if rt is not None:
+                    rt_hit_sum += rt
+                    rt_hit_n += 1
+        else:
+            n_nogo += 1
+            if outcome == "commission_error":
+                n_comm += 1
+                if rt is not None:
+                    rt_comm_sum += rt
+                    rt_comm_n += 1
 
     return {
-        "go_hit_percent": go_hit_percent,
-        "nogo_commission_percent": nogo_commission_percent,
-        "mean_rt_go_hit": mean_rt_go_hit,
-        "mean_rt_nogo_commission": mean_rt_nogo_commission,
+        "go_hit_percent": _percent(n_hit, n_go),
+        "nogo_commission_percent": _percent(n_comm, n_nogo),
+        "mean_rt_go_hit": rt_hit_sum / rt_hit_n if rt_hit_n else None,
+        "mean_rt_nogo_commission": rt_comm_sum / rt_comm_n if rt_comm_n else None,
     }
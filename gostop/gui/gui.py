@@ -1,127 +1,282 @@
 import sys
+import queue
 import threading
-from datetime import datetime
+from collections import ChainMap
+from datetime import datetime, timedelta
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Dict, List, Tuple
+from types import MappingProxyType
+from typing import Callable, Dict, List, Tuple
 
+import numpy as np
 from PyQt5 import QtCore, QtGui, QtWidgets
 
-from gostop.analysis import compute_go_nogo_metrics
-
-from core.audio import play_notification_sound
-from core.fileio import build_timestamped_path, save_pickle
+from gostop.analysis import (
+    OUTCOME_COMMISSION,
+    OUTCOME_CORRECT_WITHHOLDING,
+    OUTCOME_HIT,
+    OUTCOME_LABELS,
+    OUTCOME_MISS,
+    OUTCOME_PENDING,
+    TRIAL_LOG_DTYPE,
+    compute_trial_log_metrics,
+)
+
+from core.audio import play_notification_sound, preload_notification
+from core.fileio import HAS_LZ4, build_timestamped_path, save_pickle
 from core.randomization import compute_go_ratio, generate_trial_schedule
-from core.timing import Stopwatch, format_countdown_text, start_countdown_timer
-from core.utils import get_app_icon, set_groupbox_title_font, translate
-
-
-TRANSLATIONS = {
-    "en": {
-        "go_digits": "Go digits",
-        "nogo_digits": "No-Go digits",
-        "digit_weights": "Digit weights",
-        "digit_proportions": "Digit proportions",
-        "blocks": "Number of blocks",
-        "rest_duration": "Pre-block rest (s)",
-        "post_block_rest": "Post-block rest (s)",
-        "inter_block_interval": "Inter-block interval (s)",
-        "stimulus_duration": "Stimulus duration (s)",
-        "inter_trial_interval": "Inter-trial interval (s)",
-        "max_response_window": "Max response window (s)",
-        "notes": "Notes",
-        "language": "Language",
-        "test_mode": "Test mode",
-        "start": "Start",
-        "start_experiment": "Start Experiment",
-        "reset": "Reset",
-        "end": "End",
-        "aborted": "Aborted",
-        "block_finished": "Block {n} finished. \n Please rest.",
-        "ready": "Ready",
-        "running_block": "Running block {n}",
-        "completed": "Completed",
-        "error": "Error",
-        "ok": "OK",
-        "validation_failed": "Validation failed",
-        "file_saved": "Log file saved:\n{path}",
-        "file_save_failed": "Failed to save log file:\n{error}",
-        "abort_by_user": "user_pressed_esc",
-        "language_en": "English",
-        "language_zh": "中文",
-        "trials_per_block": "Trials per block",
-        "timing_and_blocks": "Timing and blocks",
-        "options": "Options",
-        "digits_section": "Digits (Go / No-Go)",
-        "digits_preview": "Digits preview",
-        "timing_part_a": "Global settings",
-        "timing_part_b": "Block structure",
-        "paradigm_name": "Paradigm name",
-        "output_folder": "Output folder",
-        "notes_placeholder": "Patient info / Electrode info / Notes",
-        "result_title": "Result",
-        "result_go_hit": "Go hit%",
-        "result_nogo_commission": "No-Go commission%",
-        "result_mean_rt_go": "Mean RT of go hit (s)",
-        "result_mean_rt_nogo": "Mean RT of no go commission (s)",
-        "sum": "Sum",
-    },
-    "zh": {
-        "go_digits": "Go 数字",
-        "nogo_digits": "No-Go 数字",
-        "digit_weights": "数字占比",
-        "digit_proportions": "数字占比",
-        "blocks": "区块数量",
-        "rest_duration": "区块前静息 (秒)",
-        "post_block_rest": "区块结束休息 (秒)",
-        "inter_block_interval": "区块间隔 (秒)",
-        "stimulus_duration": "刺激显示时长 (秒)",
-        "inter_trial_interval": "试次间隔 (秒)",
-        "max_response_window": "最大反应时间窗 (秒)",
-        "notes": "备注",
-        "language": "语言",
-        "test_mode": "测试模式",
-        "start": "开始",
-        "start_experiment": "开始实验",
-        "reset": "重置",
-        "end": "结束",
-        "aborted": "已中止",
-        "block_finished": "第 {n} 段结束，\n 请休息。",
-        "ready": "就绪",
-        "running_block": "正在运行第 {n} 段",
-        "completed": "已完成",
-        "error": "错误",
-        "ok": "确定",
-        "validation_failed": "验证失败",
-        "file_saved": "日志文件已保存：\n{path}",
-        "file_save_failed": "保存日志失败：\n{error}",
-        "abort_by_user": "用户按下 ESC",
-        "language_en": "English",
-        "language_zh": "中文",
-        "trials_per_block": "每段试次数",
-        "timing_and_blocks": "时间与区块",
-        "options": "选项",
-        "digits_section": "数字（Go / No-Go）",
-        "digits_preview": "数字预览",
-        "timing_part_a": "全局设置",
-        "timing_part_b": "区块结构",
-        "paradigm_name": "范式名称",
-        "output_folder": "输出文件夹",
-        "notes_placeholder": "患者信息 / 电极信息 / 备注",
-        "result_title": "结果",
-        "result_go_hit": "Go 命中率",
-        "result_nogo_commission": "No-Go 误按率",
-        "result_mean_rt_go": "Go 命中平均反应时 (秒)",
-        "result_mean_rt_nogo": "No-Go 误按平均反应时 (秒)",
-        "sum": "总计",
-    },
+from core.timing import Stopwatch, TimerCoroutine, countdown_affixes, start_countdown_timer
+from core.utils import get_app_icon, set_groupbox_title_font, translate, translate_fast
+
+
+_EN = {
+    "go_digits": "Go digits",
+    "nogo_digits": "No-Go digits",
+    "digit_weights": "Digit weights",
+    "digit_proportions": "Digit proportions",
+    "blocks": "Number of blocks",
+    "rest_duration": "Pre-block rest (s)",
+    "post_block_rest": "Post-block rest (s)",
+    "inter_block_interval": "Inter-block interval (s)",
+    "stimulus_duration": "Stimulus duration (s)",
+    "inter_trial_interval": "Inter-trial interval (s)",
+    "max_response_window": "Max response window (s)",
+    "notes": "Notes",
+    "language": "Language",
+    "test_mode": "Test mode",
+    "start": "Start",
+    "start_experiment": "Start Experiment",
+    "reset": "Reset",
+    "end": "End",
+    "aborted": "Aborted",
+    "block_finished": "Block {n} finished. \n Please rest.",
+    "ready": "Ready",
+    "preparing": "Preparing trials...",
+    "running_block": "Running block {n}",
+    "completed": "Completed",
+    "error": "Error",
+    "ok": "OK",
+    "validation_failed": "Validation failed",
+    "file_saved": "Log file saved:\n{path}",
+    "file_save_failed": "Failed to save log file:\n{error}",
+    "abort_by_user": "user_pressed_esc",
+    "language_en": "English",
+    "language_zh": "中文",
+    "trials_per_block": "Trials per block",
+    "timing_and_blocks": "Timing and blocks",
+    "options": "Options",
+    "digits_section": "Digits (Go / No-Go)",
+    "digits_preview": "Digits preview",
+    "timing_part_a": "Global settings",
+    "timing_part_b": "Block structure",
+    "paradigm_name": "Paradigm name",
+    "output_folder": "Output folder",
+    "notes_placeholder": "Patient info / Electrode info / Notes",
+    "result_title": "Result",
+    "result_go_hit": "Go hit%",
+    "result_nogo_commission": "No-Go commission%",
+    "result_mean_rt_go": "Mean RT of go hit (s)",
+    "result_mean_rt_nogo": "Mean RT of no go commission (s)",
+    "sum": "Sum",
+}
+
+_ZH = {
+    "go_digits": "Go 数字",
+    "nogo_digits": "No-Go 数字",
+    "digit_weights": "数字占比",
+    "digit_proportions": "数字占比",
+    "blocks": "区块数量",
+    "rest_duration": "区块前静息 (秒)",
+    "post_block_rest": "区块结束休息 (秒)",
+    "inter_block_interval": "区块间隔 (秒)",
+    "stimulus_duration": "刺激显示时长 (秒)",
+    "inter_trial_interval": "试次间隔 (秒)",
+    "max_response_window": "最大反应时间窗 (秒)",
+    "notes": "备注",
+    "language": "语言",
+    "test_mode": "测试模式",
+    "start": "开始",
+    "start_experiment": "开始实验",
+    "reset": "重置",
+    "end": "结束",
+    "aborted": "已中止",
+    "block_finished": "第 {n} 段结束，\n 请休息。",
+    "ready": "就绪",
+    "preparing": "正在准备试次…",
+    "running_block": "正在运行第 {n} 段",
+    "completed": "已完成",
+    "error": "错误",
+    "ok": "确定",
+    "validation_failed": "验证失败",
+    "file_saved": "日志文件已保存：\n{path}",
+    "file_save_failed": "保存日志失败：\n{error}",
+    "abort_by_user": "用户按下 ESC",
+    "language_en": "English",
+    "language_zh": "中文",
+    "trials_per_block": "每段试次数",
+    "timing_and_blocks": "时间与区块",
+    "options": "选项",
+    "digits_section": "数字（Go / No-Go）",
+    "digits_preview": "数字预览",
+    "timing_part_a": "全局设置",
+    "timing_part_b": "区块结构",
+    "paradigm_name": "范式名称",
+    "output_folder": "输出文件夹",
+    "notes_placeholder": "患者信息 / 电极信息 / 备注",
+    "result_title": "结果",
+    "result_go_hit": "Go 命中率",
+    "result_nogo_commission": "No-Go 误按率",
+    "result_mean_rt_go": "Go 命中平均反应时 (秒)",
+    "result_mean_rt_nogo": "No-Go 误按平均反应时 (秒)",
+    "sum": "总计",
 }
 
+
+def _freeze_table(table: Dict[str, str]) -> MappingProxyType:
+    return MappingProxyType({sys.intern(k): v for k, v in table.items()})
+
+
+# Read-only at runtime; keys interned so lookups with literal keys compare by identity.
+# Chinese chains to English, so a key missing from _ZH falls back without extra lookups.
+TRANSLATIONS = MappingProxyType({"en": _freeze_table(_EN), "zh": ChainMap(_freeze_table(_ZH), _freeze_table(_EN))})
+
 ICON_PATH = Path(__file__).resolve().parents[1] / "icon" / "icon.png"
 
 
+def new_trial_log(schedule: np.ndarray) -> np.ndarray:
+    """Preallocate a block's TRIAL_LOG_DTYPE log from its schedule; it is filled in place."""
+    trials = np.zeros(len(schedule), dtype=TRIAL_LOG_DTYPE)
+    trials["digit"] = schedule["digit"]
+    trials["is_go"] = schedule["is_go"]
+    trials["outcome"] = OUTCOME_PENDING
+    return trials
+
+
+def trial_log_to_dicts(trials: np.ndarray, start_datetime: datetime) -> Tuple[List[Dict], List[Dict]]:
+    """Expand a block's trial log into the (absolute, relative) trial dicts written to the saved log."""
+    rows = trials[trials["trial_index"] > 0].tolist()
+    trials_abs = [None] * len(rows)
+    trials_rel = [None] * len(rows)
+    for i, (index, digit, is_go, onset_ns, response_ns, outcome) in enumerate(rows):
+        pressed = outcome == OUTCOME_HIT or outcome == OUTCOME_COMMISSION
+        onset_abs = start_datetime + timedelta(microseconds=onset_ns / 1000)
+        if pressed:
+            response_rel = response_ns * 1e-9
+            response_abs = start_datetime + timedelta(microseconds=response_ns / 1000)
+            rt = (response_ns - onset_ns) * 1e-9
+        else:
+            response_rel = response_abs = None
+            rt = float("nan")
+        trials_rel[i] = entry = {
+            "trial_index": index,
+            "digit": digit,
+            "is_go_trial": is_go,
+            "times": (onset_ns * 1e-9, response_rel),
+            "response_key": "space" if pressed else None,
+            "outcome": OUTCOME_LABELS[outcome] if outcome < len(OUTCOME_LABELS) else None,
+            "response_time": rt,
+        }
+        # Same fields (shared objects, same key order); only the times differ.
+        trials_abs[i] = {**entry, "times": (onset_abs, response_abs)}
+    return trials_abs, trials_rel
+
+
+_FONTS: Dict[str, QtGui.QFont] = {}
+_FONT_METRICS: Dict[str, QtGui.QFontMetrics] = {}
+
+SUM_BAR_GO_STYLE = "background-color: green; color: white;"
+SUM_BAR_NOGO_STYLE = "background-color: red; color: white;"
+
+
+@lru_cache(maxsize=None)
+def _ui_font(point_size: int, bold: bool = False) -> QtGui.QFont:
+    """Return a shared variant of the application font (setFont copies it; never mutate it).
+
+    Only the attributes asked for are set, so anything else still resolves against the parent
+    widget's font (e.g. the bold group box titles).
+    """
+    font = QtGui.QFont()
+    if point_size > 0:
+        font.setPointSize(point_size)
+    if bold:
+        font.setBold(True)
+    return font
+
+
+def _get_fonts() -> Dict[str, QtGui.QFont]:
+    """Return the bold runner/result fonts, built on first use (QFont needs a QApplication)."""
+    if not _FONTS:
+        for name, point_size in (
+            ("stimulus", 360),
+            ("rest", 164),
+            ("result_title", 120),
+            ("result_label", 56),
+            ("result_value", 80),
+        ):
+            _FONTS[name] = _ui_font(point_size, True)
+    return _FONTS
+
+
+def _get_font_metrics(name: str) -> QtGui.QFontMetrics:
+    metrics = _FONT_METRICS.get(name)
+    if metrics is None:
+        metrics = _FONT_METRICS[name] = QtGui.QFontMetrics(_get_fonts()[name])
+    return metrics
+
+
+# Simplified viridis stops, interpolated once into a 256-entry table with the matching cell style.
+_VIRIDIS_STOPS = (
+    (68, 1, 84),
+    (59, 82, 139),
+    (33, 145, 140),
+    (94, 201, 98),
+    (253, 231, 37),
+)
+
+
+def _viridis_interp(t: float) -> Tuple[int, int, int]:
+    scaled = t * (len(_VIRIDIS_STOPS) - 1)
+    idx = int(scaled)
+    frac = scaled - idx
+    if idx >= len(_VIRIDIS_STOPS) - 1:
+        return _VIRIDIS_STOPS[-1]
+    c1 = _VIRIDIS_STOPS[idx]
+    c2 = _VIRIDIS_STOPS[idx + 1]
+    r = int(c1[0] + (c2[0] - c1[0]) * frac)
+    g = int(c1[1] + (c2[1] - c1[1]) * frac)
+    b = int(c1[2] + (c2[2] - c1[2]) * frac)
+    return r, g, b
+
+
+_VIRIDIS_LUT: Tuple[Tuple[int, int, int], ...] = tuple(_viridis_interp(i / 255) for i in range(256))
+# (fill, text) colours per table entry; dark text on the bright end of the map.
+_VIRIDIS_COLORS: Tuple[Tuple[QtGui.QColor, QtGui.QColor], ...] = tuple(
+    (
+        QtGui.QColor(r, g, b),
+        QtGui.QColor(QtCore.Qt.black if (r * 0.299 + g * 0.587 + b * 0.114) > 186 else QtCore.Qt.white),
+    )
+    for r, g, b in _VIRIDIS_LUT
+)
+
+
+def _viridis_index(value: float) -> int:
+    return int((0.0 if value < 0 else 1.0 if value > 1 else value) * 255)
+
+
+_SOUND_QUEUE: "queue.SimpleQueue[str]" = queue.SimpleQueue()
+
+
+def _sound_worker() -> None:
+    while True:
+        play_notification_sound(_SOUND_QUEUE.get())
+
+
+threading.Thread(target=_sound_worker, name="gostop-sound", daemon=True).start()
+
+
 def play_notification_async(sound_type: str) -> None:
-    thread = threading.Thread(target=play_notification_sound, args=(sound_type,), daemon=True)
-    thread.start()
+    """Hand the sound to the long-lived sound worker thread."""
+    _SOUND_QUEUE.put(sound_type)
 
 
 class ExperimentRunner(QtWidgets.QWidget):
@@ -134,35 +289,32 @@ class ExperimentRunner(QtWidgets.QWidget):
         self.setFocusPolicy(QtCore.Qt.StrongFocus)
         self.setAttribute(QtCore.Qt.WA_DeleteOnClose, True)
         self.language = language
+        self._tr = translate_fast(TRANSLATIONS, language)
+        self._sounds = {
+            name: preload_notification(name) or partial(play_notification_async, name)
+            for name in ("high_beep", "end_sequence")
+        }
         self.config = config
         self.meta = meta
-        self.active_timers: List[QtCore.QTimer] = []
         self.current_block_index = 0
         self.current_trial_index = -1
-        self.current_trial_entry_abs = None
-        self.current_trial_entry_rel = None
+        self.trial_logs: Dict[int, np.ndarray] = {}
         self.in_response_window = False
-        self.response_recorded = False
-        self.response_timer: QtCore.QTimer | None = None
-        self.stimulus_timer: QtCore.QTimer | None = None
-        self.experiment_aborted = False
         self.showing_results = False
         self.result_widget: QtWidgets.QWidget | None = None
-        self.first_trial_in_block = True
         self.setStyleSheet("background-color: black;")
         self.label = QtWidgets.QLabel("", self)
         self.label.setAlignment(QtCore.Qt.AlignCenter)
         self.base_label_style = "color: white; background-color: black; border: none;"
         self.label.setStyleSheet(self.base_label_style)
         self.label.setTextFormat(QtCore.Qt.RichText)
-        font = QtGui.QFont()
-        font.setPointSize(360)
-        font.setBold(True)
-        self.label.setFont(font)
-        self.stimulus_font = QtGui.QFont(font)
-        self.rest_font = QtGui.QFont(font)
-        self.rest_font.setPointSize(164)
-        self.rest_font.setBold(True)
+        fonts = _get_fonts()
+        self.stimulus_font = fonts["stimulus"]
+        self.rest_font = fonts["rest"]
+        self.label.setFont(self.stimulus_font)
+        self._label_font = self.stimulus_font
+        # Stimuli are single digits, so their label texts are built once.
+        self._digit_texts = tuple(str(d) for d in range(10))
         layout = QtWidgets.QVBoxLayout()
         layout.addWidget(self.label, alignment=QtCore.Qt.AlignCenter)
         self.setLayout(layout)
@@ -189,40 +341,39 @@ class ExperimentRunner(QtWidgets.QWidget):
         self.start_datetime = self.stopwatch.start_datetime
         self.log["timing_absolute"]["experiment_start"] = self.start_datetime
         self.log["timing_relative"]["experiment_start"] = 0.0
+        self._driver = TimerCoroutine(self.run_experiment(), self)
         self.showFullScreen()
-        self.show_start_screen()
+        self._driver.start()
 
     def t(self, key: str) -> str:
-        return translate(TRANSLATIONS, self.language, key)
-
-    def make_timer(self, ms: int, callback) -> QtCore.QTimer:
-        timer = QtCore.QTimer(self)
-        timer.setSingleShot(True)
-        timer.timeout.connect(callback)
-        timer.start(ms)
-        self.active_timers.append(timer)
-        return timer
-
-    def clear_timers(self) -> None:
-        for t in self.active_timers:
-            t.stop()
-        self.active_timers.clear()
-
-    def show_start_screen(self) -> None:
-        self.label.setText(self.t("start"))
-        self.make_timer(1000, self.start_block)
+        return self._tr(key)
 
     def set_blank_screen(self) -> None:
         self.label.setText("")
-        self.label.setStyleSheet(self.base_label_style)
 
-    def start_block(self) -> None:
-        if self.experiment_aborted:
-            return
-        if self.current_block_index >= self.config["n_blocks"]:
-            self.finish_experiment()
-            return
-        block_num = self.current_block_index + 1
+    def set_label_font(self, font: QtGui.QFont) -> None:
+        """Switch the main label's font, skipping Qt's font change when it is already set."""
+        if self._label_font is not font:
+            self.label.setFont(font)
+            self._label_font = font
+
+    def run_experiment(self):
+        """Coroutine for the whole session, stepped by self._driver.
+
+        Yields a delay in ms to sleep, or None to wait for a resume (space press or countdown end).
+        """
+        self.label.setText(self.t("start"))
+        yield 1000
+        n_blocks = self.config["n_blocks"]
+        for block_num in range(1, n_blocks + 1):
+            self.current_block_index = block_num - 1
+            yield from self.run_block(block_num)
+            if block_num < n_blocks:
+                yield from self.run_inter_block(block_num)
+        self.current_block_index = n_blocks
+        self.finish_experiment()
+
+    def run_block(self, block_num: int):
         block_start_abs, block_start_rel = self.stopwatch.timestamp_pair()
         block_abs = {
             "block_start": block_start_abs,
@@ -244,144 +395,66 @@ class ExperimentRunner(QtWidgets.QWidget):
         rest_abs, rest_rel = self.stopwatch.timestamp_pair()
         block_abs["rest_start"] = rest_abs
         block_rel["rest_start"] = rest_rel
-        rest_ms = int(self.config["rest_duration_s"] * 1000)
-        self.make_timer(rest_ms, self.start_trials)
+        yield int(self.config["rest_duration_s"] * 1000)
 
-    def start_trials(self) -> None:
-        if self.experiment_aborted:
-            return
-        block_num = self.current_block_index + 1
-        block_abs = self.log["timing_absolute"]["blocks"][block_num]
-        block_rel = self.log["timing_relative"]["blocks"][block_num]
         task_abs, task_rel = self.stopwatch.timestamp_pair()
         block_abs["task_start"] = task_abs
         block_rel["task_start"] = task_rel
-        self.current_trial_index = -1
-        self.first_trial_in_block = True
         self.block_trials = self.config["trial_schedule"][block_num]
-        self.start_next_trial()
-
-    def start_next_trial(self) -> None:
-        if self.experiment_aborted:
-            return
-        self.current_trial_index += 1
-        if self.current_trial_index >= len(self.block_trials):
-            self.finish_block()
-            return
-        self.in_response_window = False
-        self.response_recorded = False
-        self.current_trial_entry_abs = None
-        self.current_trial_entry_rel = None
-        self.set_blank_screen()
-        if self.first_trial_in_block and self.current_trial_index == 0:
-            self.first_trial_in_block = False
-            self.show_trial_stimulus()
-        else:
-            iti_ms = int(self.config["inter_trial_interval_s"] * 1000)
-            self.make_timer(iti_ms, self.show_trial_stimulus)
-
-    def show_trial_stimulus(self) -> None:
-        if self.experiment_aborted:
-            return
-        trial_info = self.block_trials[self.current_trial_index]
-        digit = trial_info["digit"]
-        self.label.setFont(self.stimulus_font)
-        self.label.setText(str(digit))
-        play_notification_async("high_beep")
-        onset_abs, onset_rel = self.stopwatch.timestamp_pair()
-        block_num = self.current_block_index + 1
-        block_abs = self.log["timing_absolute"]["blocks"][block_num]
-        block_rel = self.log["timing_relative"]["blocks"][block_num]
-
-        trial_abs = {
-            "trial_index": self.current_trial_index + 1,
-            "digit": digit,
-            "is_go_trial": trial_info["is_go"],
-            "times": (onset_abs, None),
-            "response_key": None,
-            "outcome": None,
-            "response_time": float("nan"),
-        }
-        trial_rel = {
-            "trial_index": self.current_trial_index + 1,
-            "digit": digit,
-            "is_go_trial": trial_info["is_go"],
-            "times": (onset_rel, None),
-            "response_key": None,
-            "outcome": None,
-            "response_time": float("nan"),
-        }
-        block_abs["trials"].append(trial_abs)
-        block_rel["trials"].append(trial_rel)
-        self.current_trial_entry_abs = trial_abs
-        self.current_trial_entry_rel = trial_rel
-        self.in_response_window = True
-        self.response_recorded = False
+        self.block_log = self.trial_logs[block_num] = new_trial_log(self.block_trials)
+        iti_ms = int(self.config["inter_trial_interval_s"] * 1000)
         stim_ms = int(self.config["stimulus_duration_s"] * 1000)
         resp_ms = int(self.config["max_response_window_s"] * 1000)
-        self.stimulus_timer = self.make_timer(stim_ms, self.hide_stimulus)
-        self.response_timer = self.make_timer(resp_ms, self.response_window_expired)
-
-    def hide_stimulus(self) -> None:
-        self.set_blank_screen()
+        for trial_index in range(len(self.block_trials)):
+            self.current_trial_index = trial_index
+            self.set_blank_screen()
+            if trial_index:
+                yield iti_ms
+            self.show_trial_stimulus()
+            self.in_response_window = True
+            # A space press resumes with its Stopwatch.elapsed_ns() time.
+            if stim_ms < resp_ms:
+                response = yield stim_ms
+                if response is None:
+                    self.set_blank_screen()
+                    response = yield resp_ms - stim_ms
+            else:
+                response = yield resp_ms
+            self.in_response_window = False
+            if response is not None:
+                self.set_blank_screen()
+            self.record_trial_outcome(response)
 
-    def response_window_expired(self) -> None:
-        if self.experiment_aborted:
-            return
-        if self.response_recorded or not self.in_response_window:
+    def show_trial_stimulus(self) -> None:
+        trial = self.block_log[self.current_trial_index]
+        self.set_label_font(self.stimulus_font)
+        self.label.setText(self._digit_texts[trial["digit"]])
+        self._sounds["high_beep"]()
+        trial["onset_ns"] = self.stopwatch.elapsed_ns()
+        trial["trial_index"] = self.current_trial_index + 1
+
+    def record_trial_outcome(self, response_ns: int | None) -> None:
+        """Store the outcome of the current trial; None means no key press in the response window."""
+        trial = self.block_log[self.current_trial_index]
+        is_go = bool(trial["is_go"])
+        if response_ns is None:
+            trial["outcome"] = OUTCOME_MISS if is_go else OUTCOME_CORRECT_WITHHOLDING
             return
-        self.record_trial_outcome(response_time_abs=None, response_time_rel=None, pressed=False)
-        self.in_response_window = False
-        self.response_recorded = True
-        self.start_next_trial()
+        trial["outcome"] = OUTCOME_HIT if is_go else OUTCOME_COMMISSION
+        trial["response_ns"] = response_ns
+
+    def export_trial_logs(self) -> None:
+        """Write the block trial logs into self.log as per-trial dicts (idempotent)."""
+        blocks_abs = self.log["timing_absolute"]["blocks"]
+        blocks_rel = self.log["timing_relative"]["blocks"]
+        for block_num, trials in self.trial_logs.items():
+            blocks_abs[block_num]["trials"], blocks_rel[block_num]["trials"] = trial_log_to_dicts(
+                trials, self.start_datetime
+            )
 
-    def record_trial_outcome(
-        self,
-        response_time_abs: datetime | None,
-        response_time_rel: float | None,
-        pressed: bool,
-    ) -> None:
-        if not self.current_trial_entry_abs or not self.current_trial_entry_rel:
-            return
-        trial_info = self.block_trials[self.current_trial_index]
-        is_go = trial_info["is_go"]
-        outcome = None
-        if pressed:
-            outcome = "hit" if is_go else "commission_error"
-        else:
-            outcome = "miss" if is_go else "correct_withholding"
-        abs_times = (self.current_trial_entry_abs["times"][0], response_time_abs)
-        rel_times = (self.current_trial_entry_rel["times"][0], response_time_rel)
-        self.current_trial_entry_abs["times"] = abs_times
-        self.current_trial_entry_rel["times"] = rel_times
-        self.current_trial_entry_abs["response_key"] = "space" if pressed else None
-        self.current_trial_entry_rel["response_key"] = "space" if pressed else None
-        self.current_trial_entry_abs["outcome"] = outcome
-        self.current_trial_entry_rel["outcome"] = outcome
-        rt = float("nan")
-        if pressed:
-            onset_rel = self.current_trial_entry_rel["times"][0]
-            if response_time_rel is not None and onset_rel is not None:
-                rt = response_time_rel - onset_rel
-            elif response_time_abs is not None and self.current_trial_entry_abs["times"][0] is not None:
-                try:
-                    rt = (response_time_abs - self.current_trial_entry_abs["times"][0]).total_seconds()
-                except Exception:
-                    rt = float("nan")
-        self.current_trial_entry_abs["response_time"] = rt
-        self.current_trial_entry_rel["response_time"] = rt
-
-    def finish_block(self) -> None:
-        if self.experiment_aborted:
-            return
-        block_num = self.current_block_index + 1
+    def run_inter_block(self, block_num: int):
         block_abs = self.log["timing_absolute"]["blocks"][block_num]
         block_rel = self.log["timing_relative"]["blocks"][block_num]
-        is_last_block = block_num >= self.config["n_blocks"]
-        if is_last_block:
-            self.current_block_index += 1
-            self.finish_experiment()
-            return
         rest_abs, rest_rel = self.stopwatch.timestamp_pair()
         block_abs["post_rest_start"] = rest_abs
         block_rel["post_rest_start"] = rest_rel
@@ -393,44 +466,38 @@ class ExperimentRunner(QtWidgets.QWidget):
             .replace("\n", "<br>")
         )
         max_countdown_text = f"{total_interval:06.3f}s"
-        fm = self.label.fontMetrics()
-        min_width = fm.boundingRect(max_countdown_text).width() + 40
+        min_width = _get_font_metrics("stimulus").boundingRect(max_countdown_text).width() + 40
         self.label.setMinimumWidth(min_width)
-        self.label.setFont(self.rest_font)
+        self.set_label_font(self.rest_font)
         interval_abs, interval_rel = self.stopwatch.timestamp_pair()
         self.log["timing_absolute"]["inter_block_intervals"][block_num] = {"interval_start": interval_abs}
         self.log["timing_relative"]["inter_block_intervals"][block_num] = {"interval_start": interval_rel}
 
-        def update_rest_countdown(ms_left: int) -> None:
-            countdown_html = format_countdown_text(rest_msg, ms_left, use_html=True)
-            self.label.setStyleSheet(self.base_label_style)
-            self.label.setText(countdown_html)
+        prefix, suffix = countdown_affixes(rest_msg, use_html=True)
+
+        def update_rest_countdown(ms_left: int, _set=self.label.setText) -> None:
+            _set(f"{prefix}{ms_left/1000:06.3f}s{suffix}")
 
-        self.current_block_index += 1
-        start_countdown_timer(
+        countdown = start_countdown_timer(
             parent=self,
             duration_s=total_interval,
             on_tick=update_rest_countdown,
-            on_finished=self.start_block,
-            register_timer=self.active_timers.append,
+            on_finished=self._driver.resume,
         )
-
-    def start_inter_block(self) -> None:
-        if self.experiment_aborted:
-            return
-        # Countdown now handled in finish_block; start next block immediately.
-        self.start_block()
+        try:
+            yield None
+        finally:
+            countdown.stop()
 
     def show_results_screen(self) -> None:
         if self.showing_results:
             return
         self.showing_results = True
         self.in_response_window = False
-        self.response_recorded = True
-        self.clear_timers()
+        self._driver.cancel()
 
         try:
-            metrics = compute_go_nogo_metrics(self.log)
+            metrics = compute_trial_log_metrics(np.concatenate(tuple(self.trial_logs.values())))
         except Exception:
             metrics = {
                 "go_hit_percent": None,
@@ -445,6 +512,8 @@ class ExperimentRunner(QtWidgets.QWidget):
             layout = QtWidgets.QVBoxLayout()
             self.setLayout(layout)
 
+        # Swap the stimulus label for the results grid in a single layout pass.
+        layout.setEnabled(False)
         if self.label:
             layout.removeWidget(self.label)
             self.label.hide()
@@ -453,17 +522,16 @@ class ExperimentRunner(QtWidgets.QWidget):
             self.result_widget.deleteLater()
 
         container = QtWidgets.QWidget(self)
+        container.setUpdatesEnabled(False)
         container.setStyleSheet("background-color: black; color: white;")
         vbox = QtWidgets.QVBoxLayout()
         vbox.setSpacing(40)
         vbox.setContentsMargins(80, 60, 80, 60)
         container.setLayout(vbox)
 
+        fonts = _get_fonts()
         title_lbl = QtWidgets.QLabel(self.t("result_title"))
-        title_font = QtGui.QFont()
-        title_font.setPointSize(120)
-        title_font.setBold(True)
-        title_lbl.setFont(title_font)
+        title_lbl.setFont(fonts["result_title"])
         title_lbl.setAlignment(QtCore.Qt.AlignCenter)
         vbox.addWidget(title_lbl, alignment=QtCore.Qt.AlignHCenter)
 
@@ -492,17 +560,11 @@ class ExperimentRunner(QtWidgets.QWidget):
             widget.setLayout(inner)
 
             label_lbl = QtWidgets.QLabel(label_text)
-            label_font = QtGui.QFont()
-            label_font.setPointSize(56)
-            label_font.setBold(True)
-            label_lbl.setFont(label_font)
+            label_lbl.setFont(fonts["result_label"])
             label_lbl.setAlignment(QtCore.Qt.AlignLeft)
 
             value_lbl = QtWidgets.QLabel(value_text)
-            value_font = QtGui.QFont()
-            value_font.setPointSize(80)
-            value_font.setBold(True)
-            value_lbl.setFont(value_font)
+            value_lbl.setFont(fonts["result_value"])
             value_lbl.setAlignment(QtCore.Qt.AlignLeft)
 
             inner.addWidget(label_lbl)
@@ -531,27 +593,27 @@ class ExperimentRunner(QtWidgets.QWidget):
 
         vbox.addStretch()
 
+        container.setUpdatesEnabled(True)
         layout.addWidget(container, alignment=QtCore.Qt.AlignCenter)
+        layout.setEnabled(True)
         self.result_widget = container
         self.setFocus()
         self.activateWindow()
         self.raise_()
 
     def finish_experiment(self) -> None:
-        if self.experiment_aborted:
-            return
         end_abs, end_rel = self.stopwatch.timestamp_pair()
         self.log["timing_absolute"]["experiment_end"] = end_abs
         self.log["timing_relative"]["experiment_end"] = end_rel
         self.log["status"]["completed"] = True
-        play_notification_async("end_sequence")
+        self.export_trial_logs()
+        self._sounds["end_sequence"]()
         QtCore.QTimer.singleShot(0, self.show_results_screen)
 
     def abort_experiment(self, reason: str) -> None:
-        if self.experiment_aborted:
+        if self._driver.finished:
             return
-        self.experiment_aborted = True
-        self.clear_timers()
+        self._driver.cancel()
         abort_time_abs, abort_time_rel = self.stopwatch.timestamp_pair()
         self.log["status"]["completed"] = False
         self.log["status"]["abort_reason"] = reason
@@ -559,7 +621,8 @@ class ExperimentRunner(QtWidgets.QWidget):
         self.log["status"]["abort_time_relative"] = abort_time_rel
         self.log["timing_absolute"]["experiment_end"] = abort_time_abs
         self.log["timing_relative"]["experiment_end"] = abort_time_rel
-        play_notification_async("end_sequence")
+        self.export_trial_logs()
+        self._sounds["end_sequence"]()
         QtCore.QTimer.singleShot(0, self.show_results_screen)
 
     def emit_and_close(self) -> None:
@@ -579,36 +642,158 @@ class ExperimentRunner(QtWidgets.QWidget):
             event.accept()
             return
         if event.key() == QtCore.Qt.Key_Space:
-            if not self.in_response_window or self.response_recorded:
+            if not self.in_response_window:
                 return
-            response_time_abs, response_time_rel = self.stopwatch.timestamp_pair()
-            if self.response_timer:
-                self.response_timer.stop()
-            if self.stimulus_timer:
-                self.stimulus_timer.stop()
-            self.set_blank_screen()
-            self.record_trial_outcome(response_time_abs, response_time_rel, pressed=True)
-            self.response_recorded = True
-            self.in_response_window = False
-            self.start_next_trial()
+            self._driver.resume(self.stopwatch.elapsed_ns())
             event.accept()
             return
         super().keyPressEvent(event)
 
 
+class _ScheduleSignals(QtCore.QObject):
+    ready = QtCore.pyqtSignal(object)
+    failed = QtCore.pyqtSignal(str)
+
+
+class ScheduleTask(QtCore.QRunnable):
+    """Build the trial schedules on a pool thread; results arrive through queued signals."""
+
+    def __init__(self, build: Callable[[Dict], Dict[int, np.ndarray]], config: Dict):
+        super().__init__()
+        self.signals = _ScheduleSignals()
+        self._build = build
+        self._config = config
+
+    def run(self) -> None:
+        try:
+            schedule = self._build(self._config)
+        except Exception as exc:  # any failure must reach the GUI, or Start stays disabled
+            self.signals.failed.emit(str(exc) or type(exc).__name__)
+            return
+        self.signals.ready.emit(schedule)
+
+
+class DigitHeatmap(QtWidgets.QWidget):
+    """Go/No-Go probability heatmap (2 rows x 10 digits) painted in one pass.
+
+    Cells are laid out like the grid columns they replace, so header labels placed above
+    with the same cell size and spacing stay aligned.
+    """
+
+    ROWS = ("go", "nogo")
+
+    def __init__(
+        self,
+        cell_width: int,
+        cell_height: int,
+        h_spacing: int,
+        v_spacing: int,
+        font: QtGui.QFont,
+        parent: QtWidgets.QWidget | None = None,
+    ):
+        super().__init__(parent)
+        self.cell_width = cell_width
+        self.cell_height = cell_height
+        self.h_spacing = h_spacing
+        self.v_spacing = v_spacing
+        self.setFont(font)
+        self._color_idx: List[List[int]] = [[0] * 10 for _ in self.ROWS]
+        self._texts: List[List[str]] = [["0.00"] * 10 for _ in self.ROWS]
+        # Rendered cells keyed by (colour index, text, device pixel ratio); the set of distinct
+        # cells is small, so repaints after the first are plain pixmap blits.
+        self._cell_pixmap = lru_cache(maxsize=512)(self._render_cell)
+        self.setFixedSize(
+            10 * cell_width + 9 * h_spacing,
+            len(self.ROWS) * cell_height + (len(self.ROWS) - 1) * v_spacing,
+        )
+
+    def set_probabilities(self, go_probs: np.ndarray, nogo_probs: np.ndarray, max_prob: float) -> None:
+        """Store both probability rows; repaints only if a colour or label actually changed."""
+        color_idx = []
+        texts = []
+        for probs in (go_probs, nogo_probs):
+            norm = np.clip(probs / max_prob if max_prob > 0 else np.zeros_like(probs), 0.0, 1.0)
+            color_idx.append((norm * 255).astype(np.intp).tolist())
+            texts.append([f"{p*100:.1f}" for p in probs.tolist()])
+        if color_idx == self._color_idx and texts == self._texts:
+            return
+        self._color_idx = color_idx
+        self._texts = texts
+        self.update()
+
+    def _render_cell(self, color_idx: int, text: str, dpr: float) -> QtGui.QPixmap:
+        pixmap = QtGui.QPixmap(round(self.cell_width * dpr), round(self.cell_height * dpr))
+        pixmap.setDevicePixelRatio(dpr)
+        fill, text_color = _VIRIDIS_COLORS[color_idx]
+        pixmap.fill(fill)
+        painter = QtGui.QPainter(pixmap)
+        painter.setFont(self.font())
+        painter.setPen(text_color)
+        painter.drawText(QtCore.QRect(0, 0, self.cell_width, self.cell_height), QtCore.Qt.AlignCenter, text)
+        painter.end()
+        return pixmap
+
+    def paintEvent(self, event: QtGui.QPaintEvent) -> None:
+        painter = QtGui.QPainter(self)
+        dpr = self.devicePixelRatioF()
+        step_x = self.cell_width + self.h_spacing
+        step_y = self.cell_height + self.v_spacing
+        for row, (row_idx, row_texts) in enumerate(zip(self._color_idx, self._texts)):
+            y = row * step_y
+            for d in range(10):
+                painter.drawPixmap(d * step_x, y, self._cell_pixmap(row_idx[d], row_texts[d], dpr))
+        painter.end()
+
+
 class MainWindow(QtWidgets.QMainWindow):
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Go/No-Go Task Controller")
         self.setWindowIcon(get_app_icon(ICON_PATH))
         self.language = "en"
+        self._tr = translate_fast(TRANSLATIONS, self.language)
         self.runner = None
+        self._schedule_task: ScheduleTask | None = None
+        self._error_box: QtWidgets.QMessageBox | None = None
+        self._summary_pending = False
+        # (go digits, no-go digits, weights) the preview was last drawn for.
+        self._last_summary_sig: Tuple | None = None
+        self._last_sum_bar: Tuple | None = None
         self.build_ui()
+        # (setter, translation key) for every widget text that follows the language.
+        self._i18n_targets: List[Tuple[Callable[[str], None], str]] = [
+            (self.start_button.setText, "start"),
+            (self.reset_button.setText, "reset"),
+            (self.digits_group.setTitle, "digits_section"),
+            (self.go_box.setTitle, "go_digits"),
+            (self.nogo_box.setTitle, "nogo_digits"),
+            (self.weight_box.setTitle, "digit_weights"),
+            (self.timing_box_a.setTitle, "timing_part_a"),
+            (self.timing_box_b.setTitle, "timing_part_b"),
+            (self.notes_box.setTitle, "notes"),
+            (self.notes_edit.setPlaceholderText, "notes_placeholder"),
+            (self.language_label.setText, "language"),
+            (self.test_mode_checkbox.setText, "test_mode"),
+            (self.label_blocks.setText, "blocks"),
+            (self.label_trials_per_block.setText, "trials_per_block"),
+            (self.label_paradigm.setText, "paradigm_name"),
+            (self.label_output.setText, "output_folder"),
+            (self.label_rest.setText, "rest_duration"),
+            (self.label_post_rest.setText, "post_block_rest"),
+            (self.label_ibi.setText, "inter_block_interval"),
+            (self.label_stim.setText, "stimulus_duration"),
+            (self.label_iti.setText, "inter_trial_interval"),
+            (self.label_max_resp.setText, "max_response_window"),
+            (self.preview_group.setTitle, "digits_preview"),
+            (self.preview_row_labels["go"].setText, "go_digits"),
+            (self.preview_row_labels["nogo"].setText, "nogo_digits"),
+            (self.sum_lbl.setText, "sum"),
+        ]
         self.update_language()
         self.status_label.setText("")
 
     def t(self, key: str) -> str:
-        return translate(TRANSLATIONS, self.language, key)
+        return self._tr(key)
 
     def build_ui(self) -> None:
         central = QtWidgets.QWidget()
@@ -618,9 +803,7 @@ class MainWindow(QtWidgets.QMainWindow):
 
         header_layout = QtWidgets.QHBoxLayout()
         self.language_label = QtWidgets.QLabel(self.t("language"))
-        lang_label_font = QtGui.QFont(self.language_label.font())
-        lang_label_font.setBold(True)
-        self.language_label.setFont(lang_label_font)
+        self.language_label.setFont(_ui_font(self.language_label.font().pointSize(), True))
         self.lang_en_btn = QtWidgets.QPushButton(translate(TRANSLATIONS, "en", "language_en"))
         self.lang_en_btn.setCheckable(True)
         self.lang_zh_btn = QtWidgets.QPushButton(translate(TRANSLATIONS, "zh", "language_zh"))
@@ -637,7 +820,6 @@ class MainWindow(QtWidgets.QMainWindow):
         header_layout.addWidget(self.lang_zh_btn)
         header_layout.addStretch()
         self.test_mode_checkbox = QtWidgets.QCheckBox(self.t("test_mode"))
-        self.test_mode_checkbox.stateChanged.connect(self.update_summary)
         header_layout.addWidget(self.test_mode_checkbox)
         root_layout.addLayout(header_layout)
 
@@ -649,18 +831,27 @@ class MainWindow(QtWidgets.QMainWindow):
         self.go_checkboxes: Dict[int, QtWidgets.QCheckBox] = {}
         self.nogo_checkboxes: Dict[int, QtWidgets.QCheckBox] = {}
         self.weight_spinboxes: Dict[int, QtWidgets.QDoubleSpinBox] = {}
+        # Mirror of the weight spin box values, kept current by _on_weight_changed.
+        self._weights = np.ones(10, dtype=np.float64)
 
         self.digits_group = QtWidgets.QGroupBox()
         digits_layout = QtWidgets.QVBoxLayout()
         self.digits_group.setLayout(digits_layout)
 
+        # One mapper per checkbox group turns toggled() into the digit that changed.
+        self._go_mapper = QtCore.QSignalMapper(self)
+        self._go_mapper.mappedInt.connect(self._on_go_mapped)
+        self._nogo_mapper = QtCore.QSignalMapper(self)
+        self._nogo_mapper.mappedInt.connect(self._on_nogo_mapped)
+
         self.go_box = QtWidgets.QGroupBox()
         go_layout = QtWidgets.QGridLayout()
         self.go_box.setLayout(go_layout)
         for i in range(10):
             cb = QtWidgets.QCheckBox(str(i))
             cb.setChecked(i != 9)
-            cb.toggled.connect(lambda state, d=i: self.on_go_toggled(d, state))
+            self._go_mapper.setMapping(cb, i)
+            cb.toggled.connect(self._go_mapper.map)
             self.go_checkboxes[i] = cb
             go_layout.addWidget(cb, i // 5, i % 5)
 
@@ -670,7 +861,8 @@ class MainWindow(QtWidgets.QMainWindow):
         for i in range(10):
             cb = QtWidgets.QCheckBox(str(i))
             cb.setChecked(i == 9)
-            cb.toggled.connect(lambda state, d=i: self.on_nogo_toggled(d, state))
+            self._nogo_mapper.setMapping(cb, i)
+            cb.toggled.connect(self._nogo_mapper.map)
             self.nogo_checkboxes[i] = cb
             nogo_layout.addWidget(cb, i // 5, i % 5)
 
@@ -683,7 +875,7 @@ class MainWindow(QtWidgets.QMainWindow):
             spin.setRange(0.0, 9999.0)
             spin.setSingleStep(0.1)
             spin.setValue(1.0)
-            spin.valueChanged.connect(self.update_summary)
+            spin.valueChanged.connect(partial(self._on_weight_changed, i))
             self.weight_spinboxes[i] = spin
             weight_layout.addWidget(QtWidgets.QLabel(str(i)), i // 5, (i % 5) * 2)
             weight_layout.addWidget(spin, i // 5, (i % 5) * 2 + 1)
@@ -706,7 +898,6 @@ class MainWindow(QtWidgets.QMainWindow):
         self.paradigm_name_edit = QtWidgets.QLineEdit("GoNoGo")
         self.paradigm_name_edit.setMinimumWidth(320)
         self.paradigm_name_edit.setSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Fixed)
-        self.paradigm_name_edit.textChanged.connect(self.update_summary)
         self.output_folder_edit = QtWidgets.QLineEdit(str(Path.cwd()))
         self.output_folder_edit.setMinimumWidth(320)
         self.output_folder_edit.setSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Fixed)
@@ -723,42 +914,34 @@ class MainWindow(QtWidgets.QMainWindow):
         self.n_blocks_spin = QtWidgets.QSpinBox()
         self.n_blocks_spin.setMinimum(1)
         self.n_blocks_spin.setValue(4)
-        self.n_blocks_spin.valueChanged.connect(self.update_summary)
         self.trials_per_block_spin = QtWidgets.QSpinBox()
         self.trials_per_block_spin.setMinimum(1)
         self.trials_per_block_spin.setValue(75)
-        self.trials_per_block_spin.valueChanged.connect(self.update_summary)
 
         self.rest_duration_spin = QtWidgets.QDoubleSpinBox()
         self.rest_duration_spin.setDecimals(2)
         self.rest_duration_spin.setRange(0.0, 9999.0)
         self.rest_duration_spin.setValue(10.0)
-        self.rest_duration_spin.valueChanged.connect(self.update_summary)
         self.post_rest_spin = QtWidgets.QDoubleSpinBox()
         self.post_rest_spin.setDecimals(2)
         self.post_rest_spin.setRange(0.0, 9999.0)
         self.post_rest_spin.setValue(10.0)
-        self.post_rest_spin.valueChanged.connect(self.update_summary)
         self.ibi_spin = QtWidgets.QDoubleSpinBox()
         self.ibi_spin.setDecimals(2)
         self.ibi_spin.setRange(0.0, 9999.0)
         self.ibi_spin.setValue(30.0)
-        self.ibi_spin.valueChanged.connect(self.update_summary)
         self.stim_duration_spin = QtWidgets.QDoubleSpinBox()
         self.stim_duration_spin.setDecimals(2)
         self.stim_duration_spin.setRange(0.01, 9999.0)
         self.stim_duration_spin.setValue(0.3)
-        self.stim_duration_spin.valueChanged.connect(self.update_summary)
         self.iti_spin = QtWidgets.QDoubleSpinBox()
         self.iti_spin.setDecimals(2)
         self.iti_spin.setRange(0.0, 9999.0)
         self.iti_spin.setValue(1.0)
-        self.iti_spin.valueChanged.connect(self.update_summary)
         self.max_response_spin = QtWidgets.QDoubleSpinBox()
         self.max_response_spin.setDecimals(2)
         self.max_response_spin.setRange(0.01, 9999.0)
         self.max_response_spin.setValue(0.8)
-        self.max_response_spin.valueChanged.connect(self.update_summary)
 
         self.label_blocks = QtWidgets.QLabel(self.t("blocks"))
         self.label_trials_per_block = QtWidgets.QLabel(self.t("trials_per_block"))
@@ -828,7 +1011,6 @@ class MainWindow(QtWidgets.QMainWindow):
         is_windows = sys.platform.startswith("win")
         cell_width = 52 if is_windows else 38
         cell_height = 36 if is_windows else 28
-        cell_margin = 2 if is_windows else 4
         left_margin = 14 if is_windows else 4  # nudge heatmap right on Windows
         preview_grid.setAlignment(QtCore.Qt.AlignLeft)
         preview_grid.setContentsMargins(left_margin, 4, 4, 4)
@@ -838,11 +1020,8 @@ class MainWindow(QtWidgets.QMainWindow):
         base_point = base_point if base_point > 0 else 10
         cell_point = base_point + (2 if is_windows else 0)
         header_point = cell_point + 1
-        header_font_template = QtGui.QFont(self.font())
-        header_font_template.setPointSize(header_point)
-        header_font_template.setBold(True)
-        cell_font_template = QtGui.QFont(self.font())
-        cell_font_template.setPointSize(cell_point)
+        header_font_template = _ui_font(header_point, True)
+        cell_font_template = _ui_font(cell_point)
         row_label_width = cell_width + 120 if is_windows else cell_width + 60
         preview_grid.addWidget(QtWidgets.QLabel(""), 0, 0)
         for d in range(10):
@@ -865,17 +1044,14 @@ class MainWindow(QtWidgets.QMainWindow):
         self.preview_row_labels["nogo"].setFixedWidth(row_label_width)
         preview_grid.addWidget(self.preview_row_labels["go"], 1, 0)
         preview_grid.addWidget(self.preview_row_labels["nogo"], 2, 0)
-        self.preview_cells: Dict[Tuple[str, int], QtWidgets.QLabel] = {}
-        for row_name, row_idx in (("go", 1), ("nogo", 2)):
-            for d in range(10):
-                cell = QtWidgets.QLabel("0.00")
-                cell.setAlignment(QtCore.Qt.AlignCenter)
-                cell.setMargin(cell_margin)
-                cell.setFont(cell_font_template)
-                cell.setAutoFillBackground(True)
-                cell.setFixedSize(cell_width, cell_height)
-                self.preview_cells[(row_name, d)] = cell
-                preview_grid.addWidget(cell, row_idx, d + 1)
+        self.heatmap = DigitHeatmap(
+            cell_width,
+            cell_height,
+            preview_grid.horizontalSpacing(),
+            preview_grid.verticalSpacing(),
+            cell_font_template,
+        )
+        preview_grid.addWidget(self.heatmap, 1, 1, 2, 10)
         # Sum column with stacked bars
         self.sum_bar_go = QtWidgets.QLabel("0%")
         self.sum_bar_nogo = QtWidgets.QLabel("0%")
@@ -883,8 +1059,8 @@ class MainWindow(QtWidgets.QMainWindow):
         self.sum_bar_nogo.setAlignment(QtCore.Qt.AlignCenter)
         self.sum_bar_go.setFont(cell_font_template)
         self.sum_bar_nogo.setFont(cell_font_template)
-        self.sum_bar_go.setStyleSheet("background-color: green; color: white;")
-        self.sum_bar_nogo.setStyleSheet("background-color: red; color: white;")
+        self.sum_bar_go.setStyleSheet(SUM_BAR_GO_STYLE)
+        self.sum_bar_nogo.setStyleSheet(SUM_BAR_NOGO_STYLE)
         self.sum_container = QtWidgets.QWidget()
         self.sum_layout = QtWidgets.QVBoxLayout()
         self.sum_layout.setContentsMargins(2, 2, 2, 2)
@@ -904,15 +1080,11 @@ class MainWindow(QtWidgets.QMainWindow):
         self.start_button.clicked.connect(self.start_experiment)
         self.reset_button = QtWidgets.QPushButton()
         self.reset_button.clicked.connect(self.reset_defaults)
-        btn_font = self.start_button.font()
-        btn_font.setPointSize(btn_font.pointSize() + 4)
-        btn_font.setBold(True)
+        btn_font = _ui_font(self.start_button.font().pointSize() + 4, True)
         self.start_button.setFont(btn_font)
         self.reset_button.setFont(btn_font)
         self.status_label = QtWidgets.QLabel()
-        status_font = self.status_label.font()
-        status_font.setBold(True)
-        self.status_label.setFont(status_font)
+        self.status_label.setFont(_ui_font(self.status_label.font().pointSize(), True))
         self.status_label.setAlignment(QtCore.Qt.AlignLeft | QtCore.Qt.AlignVCenter)
 
         controls_layout = QtWidgets.QHBoxLayout()
@@ -952,38 +1124,14 @@ class MainWindow(QtWidgets.QMainWindow):
 
     def update_language(self) -> None:
         self.setWindowTitle("Go/No-Go Task Controller")
-        self.start_button.setText(self.t("start"))
-        self.reset_button.setText(self.t("reset"))
         self.statusBar().showMessage("")
-        self.digits_group.setTitle(self.t("digits_section"))
-        self.go_box.setTitle(self.t("go_digits"))
-        self.nogo_box.setTitle(self.t("nogo_digits"))
-        self.weight_box.setTitle(self.t("digit_weights"))
-        self.timing_box_a.setTitle(self.t("timing_part_a"))
-        self.timing_box_b.setTitle(self.t("timing_part_b"))
-        self.notes_box.setTitle(self.t("notes"))
-        self.notes_edit.setPlaceholderText(self.t("notes_placeholder"))
-        self.language_label.setText(self.t("language"))
+        tr = self._tr
+        for setter, key in self._i18n_targets:
+            setter(tr(key))
         self.lang_en_btn.setText(translate(TRANSLATIONS, "en", "language_en"))
         self.lang_zh_btn.setText(translate(TRANSLATIONS, "zh", "language_zh"))
         self.lang_en_btn.setChecked(self.language == "en")
         self.lang_zh_btn.setChecked(self.language == "zh")
-        self.test_mode_checkbox.setText(self.t("test_mode"))
-        self.label_blocks.setText(self.t("blocks"))
-        self.label_trials_per_block.setText(self.t("trials_per_block"))
-        self.label_paradigm.setText(self.t("paradigm_name"))
-        self.label_output.setText(self.t("output_folder"))
-        self.label_rest.setText(self.t("rest_duration"))
-        self.label_post_rest.setText(self.t("post_block_rest"))
-        self.label_ibi.setText(self.t("inter_block_interval"))
-        self.label_stim.setText(self.t("stimulus_duration"))
-        self.label_iti.setText(self.t("inter_trial_interval"))
-        self.label_max_resp.setText(self.t("max_response_window"))
-        self.preview_group.setTitle(self.t("digits_preview"))
-        self.preview_row_labels["go"].setText(self.t("go_digits"))
-        self.preview_row_labels["nogo"].setText(self.t("nogo_digits"))
-        if hasattr(self, "sum_lbl"):
-            self.sum_lbl.setText(self.t("sum"))
         self.update_summary()
 
     def update_sum_bar(self, go_frac: float, nogo_frac: float) -> None:
@@ -995,25 +1143,34 @@ class MainWindow(QtWidgets.QMainWindow):
             nogo_frac /= total
         go_percent = go_frac * 100
         nogo_percent = nogo_frac * 100
+        go_text = f"{go_percent:.1f}"
+        nogo_text = f"{nogo_percent:.1f}"
+        go_stretch = max(1, int(go_percent))
+        nogo_stretch = max(1, int(nogo_percent))
+        # Everything shown is derived from these four values; skip the widget calls if none changed.
+        key = (go_text, nogo_text, go_stretch, nogo_stretch)
+        if key == self._last_sum_bar:
+            return
+        self._last_sum_bar = key
         if hasattr(self, "sum_layout"):
-            self.sum_layout.setStretch(0, max(1, int(go_percent)))
-            self.sum_layout.setStretch(1, max(1, int(nogo_percent)))
-        self.sum_bar_go.setText(f"{go_percent:.1f}")
-        self.sum_bar_nogo.setText(f"{nogo_percent:.1f}")
-        self.sum_bar_go.setToolTip(f"Go: {go_percent:.1f}%")
-        self.sum_bar_nogo.setToolTip(f"No-Go: {nogo_percent:.1f}%")
+            self.sum_layout.setStretch(0, go_stretch)
+            self.sum_layout.setStretch(1, nogo_stretch)
+        self.sum_bar_go.setText(go_text)
+        self.sum_bar_nogo.setText(nogo_text)
+        self.sum_bar_go.setToolTip(f"Go: {go_text}%")
+        self.sum_bar_nogo.setToolTip(f"No-Go: {nogo_text}%")
 
     def set_language(self, lang: str) -> None:
         if lang not in TRANSLATIONS:
             return
         self.language = lang
+        self._tr = translate_fast(TRANSLATIONS, lang)
         self.update_language()
 
     def choose_output_folder(self) -> None:
         folder = QtWidgets.QFileDialog.getExistingDirectory(self, self.t("output_folder"), self.output_folder_edit.text() or str(Path.cwd()))
         if folder:
             self.output_folder_edit.setText(folder)
-            self.update_summary()
 
     def apply_mutex_constraints(self) -> None:
         for d in range(10):
@@ -1032,6 +1189,16 @@ class MainWindow(QtWidgets.QMainWindow):
         nogo_digits = [d for d, cb in self.nogo_checkboxes.items() if cb.isChecked()]
         return go_digits, nogo_digits
 
+    def _on_weight_changed(self, digit: int, value: float) -> None:
+        self._weights[digit] = value
+        self.update_summary()
+
+    def _on_go_mapped(self, digit: int) -> None:
+        self.on_go_toggled(digit, self.go_checkboxes[digit].isChecked())
+
+    def _on_nogo_mapped(self, digit: int) -> None:
+        self.on_nogo_toggled(digit, self.nogo_checkboxes[digit].isChecked())
+
     def on_go_toggled(self, digit: int, checked: bool) -> None:
         partner = self.nogo_checkboxes[digit]
         if checked:
@@ -1056,7 +1223,7 @@ class MainWindow(QtWidgets.QMainWindow):
 
     def gather_config(self, include_schedule: bool = True) -> Dict:
         go_digits, nogo_digits = self.collect_digits()
-        digit_weights = {d: self.weight_spinboxes[d].value() for d in range(10)}
+        digit_weights = dict(enumerate(self._weights.tolist()))
 
         config = {
             "go_digits": go_digits,
@@ -1081,51 +1248,28 @@ class MainWindow(QtWidgets.QMainWindow):
         return config
 
     def viridis_color(self, value: float) -> Tuple[int, int, int]:
-        # Clamp and interpolate over simplified viridis stops
-        stops = [
-            (68, 1, 84),
-            (59, 82, 139),
-            (33, 145, 140),
-            (94, 201, 98),
-            (253, 231, 37),
-        ]
-        t = max(0.0, min(1.0, value))
-        scaled = t * (len(stops) - 1)
-        idx = int(scaled)
-        frac = scaled - idx
-        if idx >= len(stops) - 1:
-            return stops[-1]
-        c1 = stops[idx]
-        c2 = stops[idx + 1]
-        r = int(c1[0] + (c2[0] - c1[0]) * frac)
-        g = int(c1[1] + (c2[1] - c1[1]) * frac)
-        b = int(c1[2] + (c2[2] - c1[2]) * frac)
-        return r, g, b
-
-    def set_preview_cell(self, row_name: str, digit: int, prob: float, max_prob: float) -> None:
-        cell = self.preview_cells.get((row_name, digit))
-        if not cell:
-            return
-        norm = prob / max_prob if max_prob > 0 else 0.0
-        r, g, b = self.viridis_color(norm)
-        cell.setText(f"{prob*100:.1f}")
-        cell.setStyleSheet(
-            f"background-color: rgb({r}, {g}, {b}); color: {'black' if (r*0.299+g*0.587+b*0.114)>186 else 'white'};"
-        )
+        # Clamp and look up the precomputed viridis table
+        return _VIRIDIS_LUT[_viridis_index(value)]
 
-    def build_trial_schedule(self, config: Dict) -> Dict[int, List[Dict]]:
-        ratio = compute_go_ratio(config["go_digits"], config["nogo_digits"], config["digit_weights"])
-        config["go_ratio"] = ratio
-        schedule: Dict[int, List[Dict]] = {}
-        for block_idx in range(1, config["n_blocks"] + 1):
-            schedule[block_idx] = generate_trial_schedule(
-                go_digits=config["go_digits"],
-                nogo_digits=config["nogo_digits"],
-                digit_weights=config["digit_weights"],
+    def build_trial_schedule(self, config: Dict) -> Dict[int, np.ndarray]:
+        go_digits = config["go_digits"]
+        nogo_digits = config["nogo_digits"]
+        digit_weights = config["digit_weights"]
+        n_trials = config["n_trials_per_block"]
+        # validate_config already stores the ratio; only compute it when called without validation.
+        ratio = config.get("go_ratio")
+        if ratio is None:
+            ratio = config["go_ratio"] = compute_go_ratio(go_digits, nogo_digits, digit_weights)
+        return {
+            block_idx: generate_trial_schedule(
+                go_digits=go_digits,
+                nogo_digits=nogo_digits,
+                digit_weights=digit_weights,
                 go_ratio=ratio,
-                n_trials_per_block=config["n_trials_per_block"],
+                n_trials_per_block=n_trials,
             )
-        return schedule
+            for block_idx in range(1, config["n_blocks"] + 1)
+        }
 
     def gather_meta(self) -> Dict:
         notes_raw = self.notes_edit.toPlainText()
@@ -1152,16 +1296,15 @@ class MainWindow(QtWidgets.QMainWindow):
         if not nogo_digits:
             self.show_error(self.t("validation_failed"), "No-Go digits cannot be empty.")
             return False
-        overlap = set(go_digits) & set(nogo_digits)
+        overlap = set(go_digits).intersection(nogo_digits)
         if overlap:
             self.show_error(self.t("validation_failed"), f"Overlapping digits: {sorted(overlap)}")
             return False
-        go_weights = [config["digit_weights"][d] for d in go_digits if config["digit_weights"][d] > 0]
-        nogo_weights = [config["digit_weights"][d] for d in nogo_digits if config["digit_weights"][d] > 0]
-        if not go_weights:
+        digit_weights = config["digit_weights"]
+        if not any(digit_weights[d] > 0 for d in go_digits):
             self.show_error(self.t("validation_failed"), "Go digit weights must be > 0.")
             return False
-        if not nogo_weights:
+        if not any(digit_weights[d] > 0 for d in nogo_digits):
             self.show_error(self.t("validation_failed"), "No-Go digit weights must be > 0.")
             return False
         if not config.get("output_folder"):
@@ -1182,14 +1325,22 @@ class MainWindow(QtWidgets.QMainWindow):
             self.show_error(self.t("validation_failed"), "Durations must be non-negative.")
             return False
         try:
-            compute_go_ratio(go_digits, nogo_digits, config["digit_weights"])
+            config["go_ratio"] = compute_go_ratio(go_digits, nogo_digits, digit_weights)
         except ValueError as exc:
             self.show_error(self.t("validation_failed"), str(exc))
             return False
         return True
 
     def show_error(self, title: str, message: str) -> None:
-        QtWidgets.QMessageBox.critical(self, title, message, QtWidgets.QMessageBox.Ok)
+        # One critical box is created on first use and reused for every later error.
+        box = self._error_box
+        if box is None:
+            box = self._error_box = QtWidgets.QMessageBox(
+                QtWidgets.QMessageBox.Critical, "", "", QtWidgets.QMessageBox.Ok, self
+            )
+        box.setWindowTitle(title)
+        box.setText(message)
+        box.exec_()
 
     def start_experiment(self) -> None:
         try:
@@ -1199,19 +1350,32 @@ class MainWindow(QtWidgets.QMainWindow):
             return
         if not self.validate_config(config):
             return
-        try:
-            config["trial_schedule"] = self.build_trial_schedule(config)
-        except ValueError as exc:
-            self.show_error(self.t("error"), str(exc))
-            return
+        self.start_button.setEnabled(False)
+        self.reset_button.setEnabled(False)
+        self.status_label.setText(self.t("preparing"))
+        # Schedules are built off the GUI thread; the runner is created once they arrive.
+        task = ScheduleTask(self.build_trial_schedule, config)
+        task.signals.ready.connect(partial(self._on_schedule_ready, config))
+        task.signals.failed.connect(self._on_schedule_failed)
+        self._schedule_task = task
+        QtCore.QThreadPool.globalInstance().start(task)
+
+    def _on_schedule_ready(self, config: Dict, schedule: Dict[int, np.ndarray]) -> None:
+        self._schedule_task = None
+        config["trial_schedule"] = schedule
         meta = self.gather_meta()
         self.runner = ExperimentRunner(config=config, meta=meta, language=self.language)
         self.runner.experiment_finished.connect(self.handle_experiment_finished)
         self.runner.show()
         play_notification_async("start_sequence")
         self.status_label.setText(self.t("running_block").format(n=1))
-        self.start_button.setEnabled(False)
-        self.reset_button.setEnabled(False)
+
+    def _on_schedule_failed(self, message: str) -> None:
+        self._schedule_task = None
+        self.start_button.setEnabled(True)
+        self.reset_button.setEnabled(True)
+        self.status_label.setText("")
+        self.show_error(self.t("error"), message)
 
     def handle_experiment_finished(self, log: Dict) -> None:
         self.runner = None
@@ -1228,7 +1392,7 @@ class MainWindow(QtWidgets.QMainWindow):
                     folder=log["config"].get("output_folder", "."),
                     prefix=paradigm_name,
                     dt=dt_for_ts,
-                    suffix="pkl",
+                    suffix="pkl.lz4" if HAS_LZ4 else "pkl",
                 )
                 save_pickle(log, filename)
                 QtWidgets.QMessageBox.information(
@@ -1245,77 +1409,116 @@ class MainWindow(QtWidgets.QMainWindow):
         self.update_summary()
 
     def reset_defaults(self) -> None:
-        for i in range(10):
-            go_cb = self.go_checkboxes[i]
-            nogo_cb = self.nogo_checkboxes[i]
-            go_cb.blockSignals(True)
-            nogo_cb.blockSignals(True)
-            go_cb.setEnabled(True)
-            nogo_cb.setEnabled(True)
-            go_cb.setChecked(i != 9)
-            nogo_cb.setChecked(i == 9)
-            go_cb.blockSignals(False)
-            nogo_cb.blockSignals(False)
-        for spin in self.weight_spinboxes.values():
-            spin.setValue(1.0)
-        self.n_blocks_spin.setValue(4)
-        self.trials_per_block_spin.setValue(75)
-        self.rest_duration_spin.setValue(10.0)
-        self.post_rest_spin.setValue(10.0)
-        self.ibi_spin.setValue(30.0)
-        self.stim_duration_spin.setValue(0.3)
-        self.iti_spin.setValue(1.0)
-        self.max_response_spin.setValue(0.8)
-        self.paradigm_name_edit.setText("GoNoGo")
-        self.output_folder_edit.setText(str(Path.cwd()))
-        self.test_mode_checkbox.setChecked(False)
-        self.notes_edit.clear()
-        self.apply_mutex_constraints()
+        # Silence the controls while they are rewritten and refresh the summary once at the end.
+        widgets = [
+            *self.go_checkboxes.values(),
+            *self.nogo_checkboxes.values(),
+            *self.weight_spinboxes.values(),
+            self.n_blocks_spin,
+            self.trials_per_block_spin,
+            self.rest_duration_spin,
+            self.post_rest_spin,
+            self.ibi_spin,
+            self.stim_duration_spin,
+            self.iti_spin,
+            self.max_response_spin,
+            self.paradigm_name_edit,
+            self.output_folder_edit,
+            self.test_mode_checkbox,
+            self.notes_edit,
+        ]
+        for widget in widgets:
+            widget.blockSignals(True)
+        try:
+            # Digit 9 is the only No-Go digit; each checked box disables its partner.
+            for i in range(10):
+                is_go = i != 9
+                go_cb = self.go_checkboxes[i]
+                nogo_cb = self.nogo_checkboxes[i]
+                go_cb.setChecked(is_go)
+                nogo_cb.setChecked(not is_go)
+                go_cb.setEnabled(is_go)
+                nogo_cb.setEnabled(not is_go)
+            for spin in self.weight_spinboxes.values():
+                spin.setValue(1.0)
+            self._weights.fill(1.0)
+            self.n_blocks_spin.setValue(4)
+            self.trials_per_block_spin.setValue(75)
+            self.rest_duration_spin.setValue(10.0)
+            self.post_rest_spin.setValue(10.0)
+            self.ibi_spin.setValue(30.0)
+            self.stim_duration_spin.setValue(0.3)
+            self.iti_spin.setValue(1.0)
+            self.max_response_spin.setValue(0.8)
+            self.paradigm_name_edit.setText("GoNoGo")
+            self.output_folder_edit.setText(str(Path.cwd()))
+            self.test_mode_checkbox.setChecked(False)
+            self.notes_edit.clear()
+        finally:
+            for widget in widgets:
+                widget.blockSignals(False)
         self.update_summary()
 
     def update_summary(self) -> None:
+        """Schedule a preview refresh; calls made before the event loop runs again share one refresh.
+
+        Only the digit checkboxes and weights feed the preview, so only they are connected here;
+        names, folders and durations are read by gather_config when the run starts.
+        """
+        if self._summary_pending:
+            return
+        self._summary_pending = True
+        QtCore.QTimer.singleShot(0, self._do_update_summary)
+
+    def _do_update_summary(self) -> None:
+        self._summary_pending = False
         go_digits, nogo_digits = self.collect_digits()
-        weights = {d: self.weight_spinboxes[d].value() for d in range(10)}
+        weight_values = tuple(self._weights.tolist())
+        # Most controls (durations, names, block counts) do not affect the preview.
+        sig = (tuple(go_digits), tuple(nogo_digits), weight_values)
+        if sig == self._last_summary_sig:
+            return
+        self._last_summary_sig = sig
+        weights = np.array(weight_values, dtype=np.float64)
         try:
-            ratio_val = compute_go_ratio(go_digits, nogo_digits, weights)
+            ratio_val = compute_go_ratio(go_digits, nogo_digits, dict(enumerate(weight_values)))
         except ValueError:
             ratio_val = None
 
-        go_total = sum(weights[d] for d in go_digits if weights[d] > 0)
-        nogo_total = sum(weights[d] for d in nogo_digits if weights[d] > 0)
-
-        go_probs = []
-        nogo_probs = []
-        for d in range(10):
-            if ratio_val is None or go_total <= 0:
-                go_p = 0.0
-            else:
-                go_p = (weights[d] / go_total) * ratio_val if d in go_digits and weights[d] > 0 else 0.0
-            if ratio_val is None or nogo_total <= 0:
-                nogo_p = 0.0
-            else:
-                nogo_p = (
-                    (weights[d] / nogo_total) * (1 - ratio_val)
-                    if d in nogo_digits and weights[d] > 0
-                    else 0.0
-                )
-            go_probs.append(go_p)
-            nogo_probs.append(nogo_p)
-
-        max_prob = max(go_probs + nogo_probs) if (go_probs + nogo_probs) else 0.0
+        go_mask = np.zeros(10, dtype=bool)
+        go_mask[go_digits] = True
+        go_mask &= weights > 0
+        nogo_mask = np.zeros(10, dtype=bool)
+        nogo_mask[nogo_digits] = True
+        nogo_mask &= weights > 0
+        go_total = weights[go_mask].sum()
+        nogo_total = weights[nogo_mask].sum()
+
+        go_probs = np.zeros(10)
+        nogo_probs = np.zeros(10)
+        if ratio_val is not None:
+            if go_total > 0:
+                go_probs[go_mask] = weights[go_mask] / go_total * ratio_val
+            if nogo_total > 0:
+                nogo_probs[nogo_mask] = weights[nogo_mask] / nogo_total * (1 - ratio_val)
+
+        max_prob = float(max(go_probs.max(), nogo_probs.max()))
         max_prob = max_prob if max_prob > 0 else 1.0
 
-        for d in range(10):
-            self.set_preview_cell("go", d, go_probs[d], max_prob)
-            self.set_preview_cell("nogo", d, nogo_probs[d], max_prob)
-
-        # Update sum column bar
-        go_total_prob = sum(go_probs)
-        nogo_total_prob = sum(nogo_probs)
-        total = go_total_prob + nogo_total_prob
-        go_frac = go_total_prob / total if total > 0 else 0.0
-        nogo_frac = nogo_total_prob / total if total > 0 else 0.0
-        self.update_sum_bar(go_frac, nogo_frac)
+        # Update the heatmap and the sum bar with painting suspended, so the preview repaints once.
+        self.preview_group.setUpdatesEnabled(False)
+        try:
+            self.heatmap.set_probabilities(go_probs, nogo_probs, max_prob)
+
+            # Update sum column bar
+            go_total_prob = float(go_probs.sum())
+            nogo_total_prob = float(nogo_probs.sum())
+            total = go_total_prob + nogo_total_prob
+            go_frac = go_total_prob / total if total > 0 else 0.0
+            nogo_frac = nogo_total_prob / total if total > 0 else 0.0
+            self.update_sum_bar(go_frac, nogo_frac)
+        finally:
+            self.preview_group.setUpdatesEnabled(True)
 
 
 def main():
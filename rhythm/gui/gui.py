@@ -1,18 +1,23 @@
 from __future__ import annotations
 
+import math
 import sys
+import threading
 import time
-from datetime import datetime
+from array import array
+from datetime import datetime, timedelta
+from functools import partial
 from pathlib import Path
-from typing import Callable, Dict, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
 
+import numpy as np
 from PyQt5 import QtCore, QtGui, QtWidgets
 
 from core.audio import play_beep as play_rhythm_beep, play_notification_sound
 from core.config import DEFAULT_AUTHOR, ParameterState, RHYTHM_VERSION
 from core.fileio import build_timestamped_path, ensure_directory, save_pickle, timestamp_string
 from core.timing import Stopwatch, format_countdown_text, run_blocking_countdown
-from core.utils import get_app_icon, set_groupbox_title_font, translate
+from core.utils import get_app_icon, set_groupbox_title_font
 
 VERSION = RHYTHM_VERSION
 AUTHOR = DEFAULT_AUTHOR
@@ -20,6 +25,14 @@ ICON_PATH = Path(__file__).resolve().parents[1] / "icon" / "icon.png"
 
 PART_KEYS = ["rest_pre", "cued_movement", "rest_instruction", "internal_movement", "rest_post"]
 
+# Cue onsets are approached by sleeping until this close, then spinning on the clock.
+CUE_SPIN_NS = 500_000
+# Between cues the event queue is drained at about display rate, each drain capped in ms.
+EVENT_DRAIN_INTERVAL_NS = 16_000_000
+EVENT_DRAIN_MAX_MS = 4
+# Delay before the settings preview is rebuilt after the last edit.
+PREVIEW_DEBOUNCE_MS = 30
+
 
 TRANSLATIONS: Dict[str, Dict[str, str]] = {
     "app_title": {"en": "Rhythmic Movement Task", "zh": "节律运动任务"},
@@ -72,8 +85,26 @@ TRANSLATIONS: Dict[str, Dict[str, str]] = {
 }
 
 
+# Flat key -> text table per UI language (missing entries fall back to English), built once at import.
+_TR: Dict[str, Dict[str, str]] = {
+    lang: {key: entry.get(lang, entry.get("en", key)) for key, entry in TRANSLATIONS.items()} for lang in ("en", "zh")
+}
+
+
+def _tr_table(lang: str) -> Dict[str, str]:
+    return _TR.get(lang) or _TR["en"]
+
+
 def tr(key: str, lang: str) -> str:
-    return translate(TRANSLATIONS, lang, key)
+    return _tr_table(lang).get(key, key)
+
+
+def _fmt_dt(dt: datetime) -> str:
+    """Millisecond timestamp, same text as dt.strftime("%Y-%m-%d %H:%M:%S.%f")[:23]."""
+    return (
+        f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d} "
+        f"{dt.hour:02d}:{dt.minute:02d}:{dt.second:02d}.{dt.microsecond // 1000:03d}"
+    )
 
 
 class Logger:
@@ -84,7 +115,7 @@ class Logger:
             "language": params.language,
             "test_mode": params.test_mode,
             "paradigm_name": params.paradigm_name,
-            "created_at_iso": datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f")[:23],
+            "created_at_iso": _fmt_dt(datetime.now()),
         }
         self.params_dict = params.to_dict()
         self.notes = params.notes
@@ -94,12 +125,15 @@ class Logger:
         self.stopwatch: Optional[Stopwatch] = None
         self.t0_perf: Optional[float] = None
         self.t0_datetime: Optional[datetime] = None
+        # Cue times in ns since paradigm start: one array per part key, indexed by block.
+        # build_log_dict expands them into the per-block cue_events / cue_events_ms lists.
+        self._cue_ns: Dict[str, List[array]] = {}
 
     def start_paradigm(self) -> None:
         self.stopwatch = Stopwatch()
         self.t0_perf = self.stopwatch.start_perf
         self.t0_datetime = self.stopwatch.start_datetime
-        start_str = self.t0_datetime.strftime("%Y-%m-%d %H:%M:%S.%f")[:23]
+        start_str = _fmt_dt(self.t0_datetime)
         self.timeline_absolute["paradigm_start"] = start_str
         self.timeline_relative["paradigm_start_ms"] = 0
 
@@ -108,13 +142,11 @@ class Logger:
         self.timeline_absolute["paradigm_end"] = absolute_str
         self.timeline_relative["paradigm_end_ms"] = relative_ms
 
-    def get_timestamp_pair(self) -> Tuple[str, int]:
+    def get_timestamp_pair(self, _fmt=_fmt_dt) -> Tuple[str, int]:
         if self.stopwatch is None:
             self.start_paradigm()
-        now_dt, rel_seconds = self.stopwatch.timestamp_pair() if self.stopwatch else (datetime.now(), 0.0)
-        absolute_str = now_dt.strftime("%Y-%m-%d %H:%M:%S.%f")[:23]
-        relative_ms = int(rel_seconds * 1000)
-        return absolute_str, relative_ms
+        now_dt, rel_ns = self.stopwatch.timestamp_pair_ns() if self.stopwatch else (datetime.now(), 0)
+        return _fmt(now_dt), rel_ns // 1_000_000
 
     def init_blocks(self, num_blocks: int) -> None:
         self.timeline_absolute["blocks"] = []
@@ -136,6 +168,7 @@ class Logger:
             }
             self.timeline_absolute["blocks"].append(abs_block)
             self.timeline_relative["blocks"].append(rel_block)
+        self._cue_ns = {k: [array("q") for _ in range(num_blocks)] for k in PART_KEYS}
 
     def mark_block_start(self, block_index: int) -> None:
         absolute_str, relative_ms = self.get_timestamp_pair()
@@ -150,9 +183,18 @@ class Logger:
         self.timeline_relative["blocks"][block_index]["parts"][part_key]["planned_duration_s"] = planned_duration_s
 
     def log_cue_event(self, block_index: int, part_key: str) -> None:
-        absolute_str, relative_ms = self.get_timestamp_pair()
-        self.timeline_absolute["blocks"][block_index]["cue_events"][part_key].append(absolute_str)
-        self.timeline_relative["blocks"][block_index]["cue_events_ms"][part_key].append(relative_ms)
+        if self.stopwatch is None:
+            self.start_paradigm()
+        self._cue_ns[part_key][block_index].append(self.stopwatch.elapsed_ns())
+
+    def _export_cue_events(self) -> None:
+        blocks_abs = self.timeline_absolute.get("blocks", [])
+        blocks_rel = self.timeline_relative.get("blocks", [])
+        t0 = self.t0_datetime
+        for part_key, per_block in self._cue_ns.items():
+            for abs_block, rel_block, cue_ns in zip(blocks_abs, blocks_rel, per_block):
+                abs_block["cue_events"][part_key] = [_fmt_dt(t0 + timedelta(microseconds=ns / 1000)) for ns in cue_ns]
+                rel_block["cue_events_ms"][part_key] = [ns // 1_000_000 for ns in cue_ns]
 
     def mark_interval_start(self, block_index: int, interval_s: float) -> None:
         absolute_str, relative_ms = self.get_timestamp_pair()
@@ -175,6 +217,7 @@ class Logger:
         self.status["stop_relative_ms"] = relative_ms
 
     def build_log_dict(self) -> dict:
+        self._export_cue_events()
         return {
             "meta": self.meta,
             "notes": self.notes,
@@ -209,46 +252,81 @@ class StimulusWindow(QtWidgets.QWidget):
         self.mid_font.setPointSize(164)
         self.mid_font.setBold(True)
         self.display_font = QtGui.QFont(self.text_font)
-        self.multi_font = QtGui.QFont(self.rest_font)
+        self.multi_font = self.rest_font
+        # Widths of all multi_lines but the last (the countdown), measured once per message/font.
+        self._multi_head: List[str] = []
+        self._multi_head_font: Optional[QtGui.QFont] = None
+        self._multi_head_widths: List[int] = []
+        # The fonts never change after construction, so their metrics and the monospace
+        # countdown variants are built once: id(font) -> (metrics, mono font, mono metrics).
+        self._font_cache: Dict[int, Tuple[QtGui.QFontMetrics, QtGui.QFont, QtGui.QFontMetrics]] = {}
+        for font in (self.text_font, self.rest_font, self.mid_font):
+            mono_font = QtGui.QFont("Courier New")
+            mono_font.setPointSize(font.pointSize())
+            mono_font.setBold(True)
+            self._font_cache[id(font)] = (QtGui.QFontMetrics(font), mono_font, QtGui.QFontMetrics(mono_font))
         self.on_abort_requested: Optional[Callable[[], None]] = None
         self.setWindowTitle("Stimulus")
         self.setFocusPolicy(QtCore.Qt.StrongFocus)
         self.setAutoFillBackground(False)
-        self.setAttribute(QtCore.Qt.WA_DeleteOnClose, True)
+
+    def font_metrics(self, font: QtGui.QFont) -> QtGui.QFontMetrics:
+        """Cached metrics for one of the window's fonts."""
+        return self._font_cache[id(font)][0]
 
     def sizeHint(self) -> QtCore.QSize:  # pragma: no cover - GUI sizing
         return QtCore.QSize(800, 600)
 
+    # The setters below only schedule a repaint when the displayed state actually changes.
+
     def set_visual_cue_style(self, color_hex: str, radius_px: int) -> None:
-        self.visual_color = QtGui.QColor(color_hex)
-        self.visual_radius = max(5, radius_px)
+        color = QtGui.QColor(color_hex)
+        radius = max(5, radius_px)
+        if color == self.visual_color and radius == self.visual_radius:
+            return
+        self.visual_color = color
+        self.visual_radius = radius
         self.update()
 
     def set_visual_cue_visible(self, visible: bool) -> None:
+        if visible == self.visual_cue_visible:
+            return
         self.visual_cue_visible = visible
         self.update()
 
     def set_instruction(self, text: str, use_rest_font: bool = False, use_mid_font: bool = False) -> None:
+        if use_mid_font:
+            font = self.mid_font
+        elif use_rest_font:
+            font = self.rest_font
+        else:
+            font = self.text_font
+        if (
+            text == self.current_text
+            and font is self.display_font
+            and self.multi_lines is None
+            and not self.show_countdown_box
+        ):
+            return
         self.current_text = text
         self.multi_lines = None
         self.show_countdown_box = False
         self.countdown_box_size = None
-        if use_mid_font:
-            self.display_font = self.mid_font
-        elif use_rest_font:
-            self.display_font = self.rest_font
-        else:
-            self.display_font = self.text_font
+        self.display_font = font
         self.update()
 
+    @staticmethod
+    def split_message_lines(message: str) -> List[str]:
+        """Split a message on newlines/<br> into stripped, non-empty lines."""
+        return [part.strip() for part in message.replace("<br>", "\n").split("\n") if part.strip()]
+
     def set_instruction_with_countdown(self, message: str, countdown_text: str, font_choice: str = "rest") -> None:
         """Set multi-line message + countdown using chosen font ('rest'|'mid'|'text') and monospace countdown."""
-        self.multi_lines = []
-        for part in message.replace("<br>", "\n").split("\n"):
-            if part.strip():
-                self.multi_lines.append(part.strip())
-        if countdown_text.strip():
-            self.multi_lines.append(countdown_text.strip())
+        self.set_countdown_lines(self.split_message_lines(message), countdown_text.strip(), font_choice)
+
+    def set_countdown_lines(self, lines: List[str], countdown_text: str, font_choice: str = "rest") -> None:
+        """Like set_instruction_with_countdown, for lines already split and a stripped countdown."""
+        self.multi_lines = lines + [countdown_text] if countdown_text else list(lines)
         self.current_text = ""
         self.show_countdown_box = False
         self.countdown_box_size = None
@@ -259,17 +337,26 @@ class StimulusWindow(QtWidgets.QWidget):
         else:
             self.multi_font = self.rest_font
         self.display_font = self.multi_font
+        head = self.multi_lines[:-1]
+        if head != self._multi_head or self.multi_font is not self._multi_head_font:
+            fm_base = self._font_cache[id(self.multi_font)][0]
+            self._multi_head = head
+            self._multi_head_font = self.multi_font
+            self._multi_head_widths = [fm_base.horizontalAdvance(line) for line in head]
         self.update()
 
     def set_instruction_boxed(self, text: str, max_text: Optional[str] = None) -> None:
-        self.current_text = text
-        self.show_countdown_box = True
-        metrics = QtGui.QFontMetrics(self.text_font)
+        metrics = self.font_metrics(self.text_font)
         target = max_text or text
         rect = metrics.boundingRect(target)
         width = int(rect.width() * 1.2)
         height = int(rect.height() * 1.2)
-        self.countdown_box_size = QtCore.QSize(max(1, width), max(1, height))
+        box_size = QtCore.QSize(max(1, width), max(1, height))
+        if text == self.current_text and self.show_countdown_box and box_size == self.countdown_box_size:
+            return
+        self.current_text = text
+        self.show_countdown_box = True
+        self.countdown_box_size = box_size
         self.update()
 
     def clear_to_black(self) -> None:
@@ -349,64 +436,87 @@ class StimulusWindow(QtWidgets.QWidget):
                 painter.setPen(QtCore.Qt.white)
             painter.drawText(self.rect(), QtCore.Qt.AlignCenter, self.current_text)
         elif self.multi_lines:
-            # Draw multi-line message + countdown, centered
+            # Draw multi-line message + countdown, centered; only the last (monospace) line is
+            # measured here, the others were measured in set_countdown_lines.
             lines = self.multi_lines
             spacing = 20
             base_font = self.multi_font
-            fm_base = QtGui.QFontMetrics(base_font)
-            mono_font = QtGui.QFont("Courier New")
-            mono_font.setPointSize(base_font.pointSize())
-            mono_font.setBold(True)
-            fm_mono = QtGui.QFontMetrics(mono_font)
-            heights = []
-            for idx, line in enumerate(lines):
-                fm = fm_mono if idx == len(lines) - 1 else fm_base
-                heights.append(fm.height())
-            total_height = sum(heights) + spacing * (len(lines) - 1)
+            fm_base, mono_font, fm_mono = self._font_cache[id(base_font)]
+            n_head = len(lines) - 1
+            total_height = fm_base.height() * n_head + fm_mono.height() + spacing * n_head
             y = (self.height() - total_height) // 2
-            for idx, line in enumerate(lines):
-                fm = fm_mono if idx == len(lines) - 1 else fm_base
-                font = mono_font if idx == len(lines) - 1 else base_font
-                painter.setFont(font)
-                painter.setPen(QtCore.Qt.white)
-                w = fm.horizontalAdvance(line)
-                x = (self.width() - w) // 2
-                y += fm.ascent()
-                painter.drawText(x, y, line)
-                y += (fm.height() - fm.ascent()) + spacing
+            painter.setPen(QtCore.Qt.white)
+            painter.setFont(base_font)
+            for line, w in zip(lines, self._multi_head_widths):
+                y += fm_base.ascent()
+                painter.drawText((self.width() - w) // 2, y, line)
+                y += (fm_base.height() - fm_base.ascent()) + spacing
+            last = lines[-1]
+            painter.setFont(mono_font)
+            painter.drawText((self.width() - fm_mono.horizontalAdvance(last)) // 2, y + fm_mono.ascent(), last)
+
+
+# Translation keys ParadigmRunner shows during a run; resolved once per run for the current language.
+_RUNNER_STRING_KEYS = (
+    "start_label",
+    "end_label",
+    "block_rest_prompt",
+    "instruction_cued",
+    "instruction_internal",
+    "instruction_rest",
+)
 
 
 class ParadigmRunner(QtCore.QObject):
+    paradigm_finished = QtCore.pyqtSignal(dict)
+    _abort_signal = QtCore.pyqtSignal()
+
     def __init__(self, params: ParameterState, logger: Logger, stimulus_window: StimulusWindow, parent=None) -> None:
         super().__init__(parent)
         self.params = params
         self.logger = logger
         self.stimulus_window = stimulus_window
         self.abort_requested = False
+        self.abort_event = threading.Event()
+        self._strings = self._resolve_strings()
+        # Reused for every visual cue so the hot path only restarts a timer.
+        self._vis_off_timer = QtCore.QTimer(self)
+        self._vis_off_timer.setSingleShot(True)
+        self._vis_off_timer.setTimerType(QtCore.Qt.PreciseTimer)
+        self._vis_off_timer.timeout.connect(self._hide_visual_cue)
 
     def request_abort(self) -> None:
         """Abort the paradigm and immediately hide the fullscreen window.
 
-        MODIFIED: clear screen and hide window as soon as ESC is pressed.
+        MODIFIED: clear screen and hide window as soon as ESC is pressed. The window is only
+        hidden, so the caller can reuse it for the next run.
         """
         self.abort_requested = True
+        self.abort_event.set()
+        self._abort_signal.emit()
+        self._vis_off_timer.stop()
         self.stimulus_window.clear_to_black()
         self.stimulus_window.hide()
-        self.stimulus_window.close()
-        self.stimulus_window.deleteLater()
         self.stimulus_window.releaseKeyboard()
         QtWidgets.QApplication.processEvents()
 
+    def _resolve_strings(self) -> Dict[str, str]:
+        lang = self.params.language
+        return {key: tr(key, lang) for key in _RUNNER_STRING_KEYS}
+
     def run(self) -> None:
+        self._strings = self._resolve_strings()
         self.abort_requested = False
+        self.abort_event.clear()
         self.logger.start_paradigm()
         self.logger.init_blocks(self.params.num_blocks)
 
+        self.stimulus_window.clear_to_black()
         self.stimulus_window.set_visual_cue_style(self.params.visual_color_hex, self.params.visual_radius_px)
         self.stimulus_window.set_abort_callback(self.request_abort)
         self.stimulus_window.showFullScreen()
         play_notification_sound(self.params.start_sound_type)
-        self.stimulus_window.show_start_screen(800, tr("start_label", self.params.language))
+        self.stimulus_window.show_start_screen(800, self._strings["start_label"])
         self._wait_with_abort(0.8)
 
         for block_index in range(self.params.num_blocks):
@@ -418,7 +528,7 @@ class ParadigmRunner(QtCore.QObject):
                 break
             if block_index < self.params.num_blocks - 1:
                 self.logger.mark_interval_start(block_index, self.params.inter_block_interval_s)
-                rest_msg = tr("block_rest_prompt", self.params.language).format(n=block_index + 1)
+                rest_msg = self._strings["block_rest_prompt"].format(n=block_index + 1)
                 self._wait_with_countdown(self.params.inter_block_interval_s, rest_msg)
 
         self.logger.mark_paradigm_end()
@@ -427,12 +537,13 @@ class ParadigmRunner(QtCore.QObject):
         else:
             self.logger.set_status_completed()
             play_notification_sound(self.params.end_sound_type)
-            self.stimulus_window.show_end_screen(800, tr("end_label", self.params.language))
+            self.stimulus_window.show_end_screen(800, self._strings["end_label"])
             self._wait_with_abort(0.8)
+        self._vis_off_timer.stop()
         self.stimulus_window.clear_to_black()
+        self.stimulus_window.releaseKeyboard()
         self.stimulus_window.hide()
-        self.stimulus_window.close()
-        self.stimulus_window.deleteLater()
+        self.paradigm_finished.emit(self.logger.status)
 
     def _run_block(self, block_index: int) -> None:
         for part_key in PART_KEYS:
@@ -444,13 +555,13 @@ class ParadigmRunner(QtCore.QObject):
 
     def _run_part(self, part_key: str, block_index: int, duration_s: float) -> None:
         if part_key == "cued_movement":
-            self.stimulus_window.set_instruction(tr("instruction_cued", self.params.language), use_mid_font=True)
+            self.stimulus_window.set_instruction(self._strings["instruction_cued"], use_mid_font=True)
             self._run_cue_train(block_index, part_key, duration_s)
         elif part_key == "internal_movement":
-            self.stimulus_window.set_instruction(tr("instruction_internal", self.params.language), use_mid_font=True)
+            self.stimulus_window.set_instruction(self._strings["instruction_internal"], use_mid_font=True)
             self._wait_with_abort(duration_s)
         else:
-            self.stimulus_window.set_instruction(tr("instruction_rest", self.params.language), use_rest_font=True)
+            self.stimulus_window.set_instruction(self._strings["instruction_rest"], use_rest_font=True)
             self._wait_with_abort(duration_s)
         self.stimulus_window.set_visual_cue_visible(False)
         QtWidgets.QApplication.processEvents()
@@ -460,49 +571,96 @@ class ParadigmRunner(QtCore.QObject):
             self._wait_with_abort(duration_s)
             return
 
-        period_s = 1.0 / self.params.cue_frequency_hz
-        start_time = time.perf_counter()
-        next_cue_time = start_time
-
-        while time.perf_counter() - start_time < duration_s:
-            if self.abort_requested:
+        freq = self.params.cue_frequency_hz
+        duration_ns = round(duration_s * 1e9)
+        # Integer-ns onsets relative to the part start, so the cue train cannot drift. Only onsets
+        # strictly inside the part are kept: float error in duration_s * freq must not add a cue
+        # at the boundary.
+        onsets_ns = (round(i * 1e9 / freq) for i in range(math.ceil(duration_s * freq) + 1))
+        schedule_ns = [t_ns for t_ns in onsets_ns if t_ns < duration_ns]
+        timer = QtCore.QElapsedTimer()
+        # Bound once so the sleep/spin/trigger loop does no attribute lookups per cue.
+        elapsed_ns = timer.nsecsElapsed
+        sleep_until_ns = self._sleep_until_ns
+        trigger = self._trigger_cue
+        timer.start()
+        for t_ns in schedule_ns:
+            if not sleep_until_ns(timer, t_ns - CUE_SPIN_NS):
                 break
-            now = time.perf_counter()
-            if now >= next_cue_time:
-                self._trigger_cue(block_index, part_key)
-                next_cue_time += period_s
-            time.sleep(0.001)
-            QtWidgets.QApplication.processEvents()
+            while elapsed_ns() < t_ns:
+                pass
+            trigger(block_index, part_key)
+        else:
+            sleep_until_ns(timer, duration_ns)
         self.stimulus_window.set_visual_cue_visible(False)
 
+    def _sleep_until_ns(self, timer: QtCore.QElapsedTimer, target_ns: int) -> bool:
+        """Keep the GUI responsive until `timer` reaches target_ns; returns False on abort.
+
+        Events are drained on entry (so a cue just triggered is painted at once) and then
+        every EVENT_DRAIN_INTERVAL_NS rather than on every 1 ms sleep. While a visual cue is on,
+        the next drain is pulled in to its switch-off time so the cue does not outlast cue_on_time_ms.
+        """
+        elapsed_ns = timer.nsecsElapsed
+        vis_off_remaining_ms = self._vis_off_timer.remainingTime
+        process_events = QtWidgets.QApplication.processEvents
+        all_events = QtCore.QEventLoop.AllEvents
+        sleep = time.sleep
+        next_drain_ns = 0
+        while not self.abort_requested:
+            now_ns = elapsed_ns()
+            if now_ns >= next_drain_ns:
+                process_events(all_events, EVENT_DRAIN_MAX_MS)
+                now_ns = elapsed_ns()
+                next_drain_ns = now_ns + EVENT_DRAIN_INTERVAL_NS
+                vis_off_ms = vis_off_remaining_ms()
+                if vis_off_ms >= 0:  # -1 when no cue is pending switch-off
+                    next_drain_ns = min(next_drain_ns, now_ns + vis_off_ms * 1_000_000)
+            remaining_ns = target_ns - now_ns
+            if remaining_ns <= 0:
+                return True
+            sleep(min(0.001, remaining_ns / 1e9))
+        return False
+
     def _trigger_cue(self, block_index: int, part_key: str) -> None:
         self.logger.log_cue_event(block_index, part_key)
         if self.params.cue_type == "audio":
             play_rhythm_beep(self.params.cue_tone_hz, self.params.cue_on_time_ms)
         else:  # visual
             self.stimulus_window.set_visual_cue_visible(True)
-            QtCore.QTimer.singleShot(self.params.cue_on_time_ms, lambda: self.stimulus_window.set_visual_cue_visible(False))
+            self._vis_off_timer.start(self.params.cue_on_time_ms)
+
+    @QtCore.pyqtSlot()
+    def _hide_visual_cue(self) -> None:
+        self.stimulus_window.set_visual_cue_visible(False)
 
     def _wait_with_abort(self, duration_s: float) -> None:
-        end_time = time.perf_counter() + duration_s
-        while time.perf_counter() < end_time:
-            if self.abort_requested:
-                break
-            time.sleep(0.01)
-            QtWidgets.QApplication.processEvents()
+        """Run a local event loop until duration_s elapses or an abort is requested."""
+        if self.abort_requested or duration_s <= 0:
+            return
+        loop = QtCore.QEventLoop()
+        timer = QtCore.QTimer(loop)
+        timer.setTimerType(QtCore.Qt.PreciseTimer)
+        timer.setSingleShot(True)
+        timer.timeout.connect(loop.quit)
+        self._abort_signal.connect(loop.quit)
+        try:
+            timer.start(int(duration_s * 1000))
+            loop.exec_()
+        finally:
+            self._abort_signal.disconnect(loop.quit)
 
     def _wait_with_countdown(self, duration_s: float, rest_text: str | None = None) -> None:
-        lang = self.params.language
         if rest_text is None:
-            rest_text = tr("instruction_rest", lang)
+            rest_text = self._strings["instruction_rest"]
         max_countdown_text = f"{duration_s:06.3f}s"
-        metrics = QtGui.QFontMetrics(self.stimulus_window.rest_font)
-        min_width = metrics.boundingRect(max_countdown_text).width() + 40
+        metrics = self.stimulus_window.font_metrics(self.stimulus_window.rest_font)
+        self.stimulus_window.setMinimumWidth(metrics.boundingRect(max_countdown_text).width() + 40)
+        rest_lines = self.stimulus_window.split_message_lines(rest_text)
 
         def on_tick(ms_left: int) -> None:
             countdown_str = f"{ms_left/1000:06.3f}s"
-            self.stimulus_window.set_instruction_with_countdown(rest_text, countdown_str, font_choice="text")
-            self.stimulus_window.setMinimumWidth(min_width)
+            self.stimulus_window.set_countdown_lines(rest_lines, countdown_str, font_choice="text")
             QtWidgets.QApplication.processEvents()
 
         def on_finished() -> None:
@@ -514,6 +672,7 @@ class ParadigmRunner(QtCore.QObject):
             on_finished=on_finished,
             check_abort=lambda: self.abort_requested,
             step_s=0.01,
+            abort_event=self.abort_event,
         )
 
 
@@ -528,44 +687,53 @@ class TimelinePreviewWidget(QtWidgets.QWidget):
             "internal_movement": QtGui.QColor("#38A169"),
             "rest_post": QtGui.QColor("#A0AEC0"),
         }
+        self.interval_color = QtGui.QColor("#1a202c")
+        self._segment_colors = [self.part_colors[k] for k in PART_KEYS] + [self.interval_color]
+        self._load_durations()
+        self._rebuild_layout()
         self.setMinimumHeight(60)
         self.setMinimumWidth(600)
         self.setSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Fixed)
 
     def set_parameters(self, params: ParameterState) -> None:
         self.params = params
+        self._load_durations()
+        self._rebuild_layout()
         self.update()
 
-    def paintEvent(self, event) -> None:  # pragma: no cover - GUI paint
-        painter = QtGui.QPainter(self)
-        total_block_duration = sum(self.params.part_durations_s.values())
-        total_block_duration += self.params.inter_block_interval_s
-        if total_block_duration <= 0:
+    def _load_durations(self) -> None:
+        """Cache the segment durations (parts, then the inter-block interval) and their labels."""
+        durations = [self.params.part_durations_s.get(k, 0) for k in PART_KEYS]
+        durations.append(self.params.inter_block_interval_s)
+        self._durations = np.array(durations, dtype=np.float64)
+        self._total_s = sum(self.params.part_durations_s.values()) + self.params.inter_block_interval_s
+        self._labels = [f"{d:.1f}" for d in durations]
+
+    def _rebuild_layout(self) -> None:
+        """Precompute (rect, colour, label) per segment; only parameters and size change them."""
+        self._layout: List[Tuple[QtCore.QRect, QtGui.QColor, str]] = []
+        if self._total_s <= 0:
             return
-        width = self.rect().width()
-        height = self.rect().height()
-        block_height = max(30, height - 5)
+        span = self.rect().width() - 20
+        h = max(1, int(max(30, self.rect().height() - 5) - 20))
         y = 10
-        x = 10
-        for part_key in PART_KEYS:
-            part_dur = self.params.part_durations_s.get(part_key, 0)
-            w = int((part_dur / total_block_duration) * (width - 20))
-            h = int(block_height - 20)
-            rect = QtCore.QRect(int(x), int(y), max(1, w), max(1, h))
-            painter.fillRect(rect, self.part_colors[part_key])
+        widths = (self._durations / self._total_s * span).astype(np.int64)
+        xs = np.cumsum(widths) - widths + 10
+        for x, w, color, label in zip(xs.tolist(), widths.tolist(), self._segment_colors, self._labels):
+            self._layout.append((QtCore.QRect(x, y, max(1, w), h), color, label))
+
+    def resizeEvent(self, event) -> None:  # pragma: no cover - GUI sizing
+        self._rebuild_layout()
+        super().resizeEvent(event)
+
+    def paintEvent(self, event) -> None:  # pragma: no cover - GUI paint
+        painter = QtGui.QPainter(self)
+        for rect, color, label in self._layout:
+            painter.fillRect(rect, color)
             painter.setPen(QtCore.Qt.black)
             painter.drawRect(rect)
-            duration_text = f"{part_dur:.1f}"
             painter.setPen(QtCore.Qt.white)
-            painter.drawText(rect, QtCore.Qt.AlignCenter, duration_text)
-            x += w
-        interval_w = int((self.params.inter_block_interval_s / total_block_duration) * (width - 20))
-        interval_rect = QtCore.QRect(int(x), int(y), max(1, interval_w), max(1, int(block_height - 20)))
-        painter.fillRect(interval_rect, QtGui.QColor("#1a202c"))
-        painter.setPen(QtCore.Qt.black)
-        painter.drawRect(interval_rect)
-        painter.setPen(QtCore.Qt.white)
-        painter.drawText(interval_rect, QtCore.Qt.AlignCenter, f"{self.params.inter_block_interval_s:.1f}")
+            painter.drawText(rect, QtCore.Qt.AlignCenter, label)
 
 
 class MainWindow(QtWidgets.QMainWindow):
@@ -576,9 +744,21 @@ class MainWindow(QtWidgets.QMainWindow):
         self.last_params: Optional[ParameterState] = None
         self.current_status_key = "status_ready"
         self._preview_overlay: Optional[StimulusWindow] = None
+        self._preview_hide_timer: Optional[QtCore.QTimer] = None
+        # Created on the first start and reused (hidden in between) for later runs.
+        self.stimulus_window: Optional[StimulusWindow] = None
+        self.runner: Optional[ParadigmRunner] = None
         self.timeline_widget = TimelinePreviewWidget(self.params)
         self.status_label = QtWidgets.QLabel(tr("status_ready", self.params.language))
         self.test_mode_checkbox_top: Optional[QtWidgets.QCheckBox] = None
+        # Translatable form labels and group boxes -> translation key, filled while building the UI.
+        self._label_keys: Dict[QtWidgets.QLabel, str] = {}
+        self._group_keys: Dict[QtWidgets.QGroupBox, str] = {}
+        # Bursts of preview updates (spinbox ticks, a language switch) collapse into one refresh.
+        self._preview_timer = QtCore.QTimer(self)
+        self._preview_timer.setSingleShot(True)
+        self._preview_timer.setInterval(PREVIEW_DEBOUNCE_MS)
+        self._preview_timer.timeout.connect(self._refresh_timeline)
 
         self._build_ui()
         self.test_mode_checkbox_top.setChecked(self.params.test_mode)
@@ -620,7 +800,7 @@ class MainWindow(QtWidgets.QMainWindow):
         root_layout.addLayout(main_grid)
 
         # Global settings spanning two columns
-        global_group = QtWidgets.QGroupBox(tr("global_settings", self.params.language))
+        global_group = self._make_group("global_settings")
         global_layout = QtWidgets.QFormLayout()
         self.paradigm_name_edit = QtWidgets.QLineEdit("Rhythm")
         self.paradigm_name_edit.setMinimumWidth(420)
@@ -637,20 +817,20 @@ class MainWindow(QtWidgets.QMainWindow):
         output_line.addWidget(self.output_folder_button)
         output_widget = QtWidgets.QWidget()
         output_widget.setLayout(output_line)
-        global_layout.addRow(QtWidgets.QLabel(tr("paradigm_name", self.params.language)), self.paradigm_name_edit)
-        global_layout.addRow(QtWidgets.QLabel(tr("output_folder", self.params.language)), output_widget)
+        global_layout.addRow(self._make_label("paradigm_name"), self.paradigm_name_edit)
+        global_layout.addRow(self._make_label("output_folder"), output_widget)
         global_group.setLayout(global_layout)
         main_grid.addWidget(global_group, 0, 0, 1, 2)
 
         # Timeline preview spanning two columns
-        preview_group = QtWidgets.QGroupBox(tr("timeline_preview", self.params.language))
+        preview_group = self._make_group("timeline_preview")
         pv_layout = QtWidgets.QVBoxLayout()
         pv_layout.addWidget(self.timeline_widget)
         preview_group.setLayout(pv_layout)
         main_grid.addWidget(preview_group, 1, 0, 1, 2)
 
         # Block structure (left)
-        block_group = QtWidgets.QGroupBox(tr("block_structure", self.params.language))
+        block_group = self._make_group("block_structure")
         block_layout = QtWidgets.QGridLayout()
         self.num_blocks_spin = QtWidgets.QSpinBox()
         self.num_blocks_spin.setRange(1, 100)
@@ -662,6 +842,8 @@ class MainWindow(QtWidgets.QMainWindow):
         self.inter_block_spin.valueChanged.connect(self.update_timeline_preview)
         entries = [("num_blocks", self.num_blocks_spin), ("inter_block_interval", self.inter_block_spin)]
         self.part_spinboxes: Dict[str, QtWidgets.QDoubleSpinBox] = {}
+        # Mirror of the part duration spin box values, kept current by _on_part_duration_changed.
+        self._part_values: Dict[str, float] = {}
         defaults = {
             "rest_pre": 10.0,
             "cued_movement": 30.0,
@@ -674,21 +856,25 @@ class MainWindow(QtWidgets.QMainWindow):
             spin.setRange(0, 600)
             spin.setSingleStep(0.5)
             spin.setValue(defaults.get(key, self.params.part_durations_s.get(key, 0)))
+            self._part_values[key] = float(spin.value())
+            spin.valueChanged.connect(partial(self._on_part_duration_changed, key))
             spin.valueChanged.connect(self.update_timeline_preview)
             self.part_spinboxes[key] = spin
             entries.append((key, spin))
         for row, (key, widget) in enumerate(entries):
-            block_layout.addWidget(QtWidgets.QLabel(tr(key, self.params.language)), row, 0)
+            block_layout.addWidget(self._make_label(key), row, 0)
             block_layout.addWidget(widget, row, 1)
         block_group.setLayout(block_layout)
         main_grid.addWidget(block_group, 2, 0)
 
         # Right column stack: Cue settings, Notes, Controls
-        cue_group = QtWidgets.QGroupBox(tr("cue_settings", self.params.language))
+        cue_group = self._make_group("cue_settings")
         cue_layout = QtWidgets.QGridLayout()
         self.cue_type_combo = QtWidgets.QComboBox()
         self.cue_type_combo.addItem(tr("cue_audio", self.params.language), "audio")
         self.cue_type_combo.addItem(tr("cue_visual", self.params.language), "visual")
+        # Combo index per cue type, so relabelling needs no itemData scan.
+        self._cue_type_indices = {data: self.cue_type_combo.findData(data) for data in ("audio", "visual")}
         idx = self.cue_type_combo.findData(self.params.cue_type)
         if idx >= 0:
             self.cue_type_combo.setCurrentIndex(idx)
@@ -705,6 +891,9 @@ class MainWindow(QtWidgets.QMainWindow):
         self.cue_on_time_spin.setRange(10, 2000)
         self.cue_on_time_spin.setValue(self.params.cue_on_time_ms)
         self.visual_color_edit = QtWidgets.QLineEdit(self.params.visual_color_hex)
+        self.visual_color_edit.setValidator(
+            QtGui.QRegularExpressionValidator(QtCore.QRegularExpression("#[0-9A-Fa-f]{0,6}"), self.visual_color_edit)
+        )
         self.visual_color_button = QtWidgets.QPushButton("🎨")
         self.visual_color_button.clicked.connect(self.choose_color)
         self.visual_radius_spin = QtWidgets.QSpinBox()
@@ -713,29 +902,29 @@ class MainWindow(QtWidgets.QMainWindow):
         self.preview_button = QtWidgets.QPushButton(tr("preview_cue", self.params.language))
         self.preview_button.clicked.connect(self.preview_cue)
 
-        cue_layout.addWidget(QtWidgets.QLabel(tr("cue_type", self.params.language)), 0, 0)
+        cue_layout.addWidget(self._make_label("cue_type"), 0, 0)
         cue_layout.addWidget(self.cue_type_combo, 0, 1)
-        cue_layout.addWidget(QtWidgets.QLabel(tr("cue_frequency", self.params.language)), 1, 0)
+        cue_layout.addWidget(self._make_label("cue_frequency"), 1, 0)
         cue_layout.addWidget(self.cue_freq_spin, 1, 1)
-        cue_layout.addWidget(QtWidgets.QLabel(tr("cue_on_time", self.params.language)), 2, 0)
+        cue_layout.addWidget(self._make_label("cue_on_time"), 2, 0)
         cue_layout.addWidget(self.cue_on_time_spin, 2, 1)
-        cue_layout.addWidget(QtWidgets.QLabel(tr("cue_tone", self.params.language)), 3, 0)
+        cue_layout.addWidget(self._make_label("cue_tone"), 3, 0)
         tone_line = QtWidgets.QHBoxLayout()
         tone_line.setContentsMargins(0, 0, 0, 0)
         tone_line.addWidget(self.cue_tone_spin)
         tone_line.addWidget(self.preview_button)
         cue_layout.addLayout(tone_line, 3, 1)
-        cue_layout.addWidget(QtWidgets.QLabel(tr("visual_color", self.params.language)), 4, 0)
+        cue_layout.addWidget(self._make_label("visual_color"), 4, 0)
         color_line = QtWidgets.QHBoxLayout()
         color_line.setContentsMargins(0, 0, 0, 0)
         color_line.addWidget(self.visual_color_edit)
         color_line.addWidget(self.visual_color_button)
         cue_layout.addLayout(color_line, 4, 1)
-        cue_layout.addWidget(QtWidgets.QLabel(tr("visual_radius", self.params.language)), 5, 0)
+        cue_layout.addWidget(self._make_label("visual_radius"), 5, 0)
         cue_layout.addWidget(self.visual_radius_spin, 5, 1)
         cue_group.setLayout(cue_layout)
 
-        notes_group = QtWidgets.QGroupBox(tr("notes", self.params.language))
+        notes_group = self._make_group("notes")
         notes_layout = QtWidgets.QVBoxLayout()
         self.notes_edit = QtWidgets.QTextEdit(self.params.notes)
         self.notes_edit.setPlaceholderText(tr("notes_placeholder", self.params.language))
@@ -783,88 +972,78 @@ class MainWindow(QtWidgets.QMainWindow):
         root_layout.addLayout(footer)
 
         # Apply groupbox title font similar to GoStop
-        for gb in [global_group, preview_group, block_group, cue_group, notes_group]:
+        for gb in self._group_keys:
             set_groupbox_title_font(gb, 12)
-        # Bolden labels inside group boxes similar to GoStop
-        for lbl in self.findChildren(QtWidgets.QLabel):
+        # Bolden labels inside group boxes similar to GoStop; every QLabel is known, so no tree walk.
+        all_labels = [*self._label_keys, self.language_label, self.status_label, self.signature_label]
+        for lbl in all_labels:
             f = lbl.font()
             f.setBold(True)
             lbl.setFont(f)
 
+    def _make_label(self, key: str) -> QtWidgets.QLabel:
+        """Create a QLabel for a translation key and remember it for relabelling."""
+        lbl = QtWidgets.QLabel(tr(key, self.params.language))
+        self._label_keys[lbl] = key
+        return lbl
+
+    def _make_group(self, key: str) -> QtWidgets.QGroupBox:
+        """Create a QGroupBox titled by a translation key and remember it for relabelling."""
+        group = QtWidgets.QGroupBox(tr(key, self.params.language))
+        self._group_keys[group] = key
+        return group
+
+    @QtCore.pyqtSlot(str)
     def set_language(self, lang: str) -> None:
         if lang not in ("en", "zh"):
             return
         self.params.language = lang
         self.language_en_button.setChecked(lang == "en")
         self.language_zh_button.setChecked(lang == "zh")
-        self.update_language()
+        # Retranslate with painting suspended so Qt relayouts and repaints once at the end.
+        self.setUpdatesEnabled(False)
+        try:
+            self.update_language()
+        finally:
+            self.setUpdatesEnabled(True)
 
     def update_language(self) -> None:
-        lang = self.params.language
-        self.setWindowTitle(tr("app_title", lang))
-        self.signature_label.setText(tr("mojack_version", lang))
-        self.status_label.setText(tr(self.current_status_key, lang))
+        t = _tr_table(self.params.language)
+        self.setWindowTitle(t["app_title"])
+        self.signature_label.setText(t["mojack_version"])
+        self.status_label.setText(t[self.current_status_key])
         self.output_folder_button.setText("...")
-        self.preview_button.setText(tr("preview_cue", lang))
-        self.start_button.setText(tr("start_button", lang))
-        self.reset_button.setText(tr("reset_button", lang))
-        self.notes_edit.setPlaceholderText(tr("notes_placeholder", lang))
+        self.preview_button.setText(t["preview_cue"])
+        self.start_button.setText(t["start_button"])
+        self.reset_button.setText(t["reset_button"])
+        self.notes_edit.setPlaceholderText(t["notes_placeholder"])
 
-        self.language_en_button.setText(tr("language_en", lang))
-        self.language_zh_button.setText(tr("language_zh", lang))
+        self.language_en_button.setText(t["language_en"])
+        self.language_zh_button.setText(t["language_zh"])
         if hasattr(self, "language_label"):
-            self.language_label.setText(tr("language_label", lang))
-        self.test_mode_checkbox_top.setText(tr("test_mode", lang))
+            self.language_label.setText(t["language_label"])
+        self.test_mode_checkbox_top.setText(t["test_mode"])
         self._update_cue_type_labels()
         self.update_group_titles()
-        self.timeline_widget.set_parameters(self.gather_config(update_only=True))
 
     def _update_cue_type_labels(self) -> None:
-        lang = self.params.language
-        for idx in range(self.cue_type_combo.count()):
-            data = self.cue_type_combo.itemData(idx)
-            if data == "audio":
-                self.cue_type_combo.setItemText(idx, tr("cue_audio", lang))
-            elif data == "visual":
-                self.cue_type_combo.setItemText(idx, tr("cue_visual", lang))
+        t = _tr_table(self.params.language)
+        self.cue_type_combo.setItemText(self._cue_type_indices["audio"], t["cue_audio"])
+        self.cue_type_combo.setItemText(self._cue_type_indices["visual"], t["cue_visual"])
 
     def update_group_titles(self) -> None:
-        lang = self.params.language
-        for widget in self.findChildren(QtWidgets.QGroupBox):
-            title = widget.title()
-            for key in ["cue_settings", "block_structure", "timeline_preview", "global_settings", "notes"]:
-                if title == tr(key, "en") or title == tr(key, "zh"):
-                    widget.setTitle(tr(key, lang))
+        t = _tr_table(self.params.language)
+        for group, key in self._group_keys.items():
+            group.setTitle(t[key])
         self.update_form_labels()
-        self.timeline_widget.set_parameters(self.gather_config(update_only=True))
+        self.update_timeline_preview()
 
     def update_form_labels(self) -> None:
-        lang = self.params.language
-        labels = self.centralWidget().findChildren(QtWidgets.QLabel)
-        for lbl in labels:
-            text = lbl.text()
-            for key in [
-                "paradigm_name",
-                "num_blocks",
-                "inter_block_interval",
-                "cue_type",
-                "cue_frequency",
-                "cue_tone",
-                "cue_on_time",
-                "visual_color",
-                "visual_radius",
-                "output_folder",
-                "notes",
-                "rest_pre",
-                "cued_movement",
-                "rest_instruction",
-                "internal_movement",
-                "rest_post",
-                "timeline_preview",
-            ]:
-                if text in (tr(key, "en"), tr(key, "zh")):
-                    lbl.setText(tr(key, lang))
+        t = _tr_table(self.params.language)
+        for lbl, key in self._label_keys.items():
+            lbl.setText(t[key])
 
+    @QtCore.pyqtSlot()
     def sync_test_mode(self) -> None:
         sender = self.sender()
         checked = bool(sender.isChecked()) if sender and hasattr(sender, "isChecked") else bool(self.params.test_mode)
@@ -874,11 +1053,13 @@ class MainWindow(QtWidgets.QMainWindow):
             self.test_mode_checkbox_top.blockSignals(False)
         self.params.test_mode = checked
 
+    @QtCore.pyqtSlot()
     def choose_color(self) -> None:
         color = QtWidgets.QColorDialog.getColor(QtGui.QColor(self.visual_color_edit.text()), self, "Select color")
         if color.isValid():
             self.visual_color_edit.setText(color.name())
 
+    @QtCore.pyqtSlot()
     def choose_output_folder(self) -> None:
         folder = QtWidgets.QFileDialog.getExistingDirectory(
             self, tr("output_folder", self.params.language), self.output_folder_edit.text()
@@ -886,27 +1067,34 @@ class MainWindow(QtWidgets.QMainWindow):
         if folder:
             self.output_folder_edit.setText(folder)
 
+    @QtCore.pyqtSlot()
     def preview_cue(self) -> None:
-        params = self.gather_config(update_only=True)
-        if params.cue_type == "audio":
-            play_rhythm_beep(params.cue_tone_hz, params.cue_on_time_ms)
+        # Only a few cue fields matter here, so read them straight from the widgets.
+        cue_type = self.cue_type_combo.currentData() or self.cue_type_combo.currentText()
+        cue_on_time_ms = int(self.cue_on_time_spin.value())
+        if cue_type == "audio":
+            play_rhythm_beep(float(self.cue_tone_spin.value()), cue_on_time_ms)
         else:
-            overlay = StimulusWindow()
-            overlay.set_visual_cue_style(params.visual_color_hex, params.visual_radius_px)
+            overlay = self._preview_overlay
+            if overlay is None:
+                # Built on the first visual preview, then only re-shown and hidden again.
+                overlay = self._preview_overlay = StimulusWindow()
+                self._preview_hide_timer = QtCore.QTimer(self)
+                self._preview_hide_timer.setSingleShot(True)
+                self._preview_hide_timer.timeout.connect(overlay.hide)
+            overlay.set_visual_cue_style(self.visual_color_edit.text(), int(self.visual_radius_spin.value()))
             overlay.set_instruction("")
-            overlay.show()
             overlay.set_visual_cue_visible(True)
-            QtCore.QTimer.singleShot(params.cue_on_time_ms, overlay.close)
-            self._preview_overlay = overlay
+            overlay.show()
+            self._preview_hide_timer.start(cue_on_time_ms)
 
     def validate_config(self, params: ParameterState) -> Optional[str]:
         if params.cue_frequency_hz <= 0:
             return "Cue frequency must be > 0"
+        # The colour field's validator only admits '#' plus hex digits, but a partial entry is still possible.
         if not params.visual_color_hex.startswith("#") or len(params.visual_color_hex) != 7:
             return "Visual color must be in #RRGGBB format"
-        for key, val in params.part_durations_s.items():
-            if val < 0:
-                return f"Duration for {key} must be >= 0"
+        # Part durations need no check here: their spin boxes are limited to 0-600 s.
         if params.num_blocks <= 0:
             return "Number of blocks must be > 0"
         if params.inter_block_interval_s < 0:
@@ -914,51 +1102,79 @@ class MainWindow(QtWidgets.QMainWindow):
         return None
 
     def gather_config(self, update_only: bool = False) -> ParameterState:
-        params = ParameterState.from_defaults()
-        params.paradigm_name = self.paradigm_name_edit.text()
-        params.language = self.params.language
-        params.test_mode = self.test_mode_checkbox_top.isChecked() if self.test_mode_checkbox_top else False
-        params.cue_type = self.cue_type_combo.currentData() or self.cue_type_combo.currentText()
-        params.cue_frequency_hz = float(self.cue_freq_spin.value())
-        params.cue_tone_hz = float(self.cue_tone_spin.value())
-        params.cue_on_time_ms = int(self.cue_on_time_spin.value())
-        params.start_sound_type = self.params.start_sound_type
-        params.end_sound_type = self.params.end_sound_type
-        params.visual_color_hex = self.visual_color_edit.text()
-        params.visual_radius_px = int(self.visual_radius_spin.value())
-        params.num_blocks = int(self.num_blocks_spin.value())
-        params.inter_block_interval_s = float(self.inter_block_spin.value())
-        params.part_durations_s = {k: float(spin.value()) for k, spin in self.part_spinboxes.items()}
-        params.output_folder = self.output_folder_edit.text()
-        params.file_prefix = (params.paradigm_name or "").strip() or "Rhythm"
-        params.notes = self.notes_edit.toPlainText()
+        # Every field comes from the widgets, so build the state directly rather than overwriting defaults.
+        paradigm_name = self.paradigm_name_edit.text()
+        params = ParameterState(
+            paradigm_name=paradigm_name,
+            language=self.params.language,
+            test_mode=self.test_mode_checkbox_top.isChecked() if self.test_mode_checkbox_top else False,
+            cue_type=self.cue_type_combo.currentData() or self.cue_type_combo.currentText(),
+            cue_frequency_hz=float(self.cue_freq_spin.value()),
+            cue_tone_hz=float(self.cue_tone_spin.value()),
+            cue_on_time_ms=int(self.cue_on_time_spin.value()),
+            start_sound_type=self.params.start_sound_type,
+            end_sound_type=self.params.end_sound_type,
+            visual_color_hex=self.visual_color_edit.text(),
+            visual_radius_px=int(self.visual_radius_spin.value()),
+            num_blocks=int(self.num_blocks_spin.value()),
+            inter_block_interval_s=float(self.inter_block_spin.value()),
+            part_durations_s=dict(self._part_values),
+            output_folder=self.output_folder_edit.text(),
+            file_prefix=(paradigm_name or "").strip() or "Rhythm",
+            notes=self.notes_edit.toPlainText(),
+        )
         if not update_only:
             self.params = params
         return params
 
+    @QtCore.pyqtSlot()
     def reset_defaults(self) -> None:
-        self.paradigm_name_edit.setText("Rhythm")
-        self.num_blocks_spin.setValue(4)
-        self.output_folder_edit.setText(self.params.output_folder)
-        self.inter_block_spin.setValue(30.0)
-        defaults = {
-            "rest_pre": 10.0,
-            "cued_movement": 30.0,
-            "rest_instruction": 5.0,
-            "internal_movement": 30.0,
-            "rest_post": 10.0,
-        }
-        for key, spin in self.part_spinboxes.items():
-            spin.setValue(defaults.get(key, 0.0))
-        self.cue_type_combo.setCurrentText(self.params.cue_type)
-        self.cue_freq_spin.setValue(self.params.cue_frequency_hz)
-        self.cue_tone_spin.setValue(self.params.cue_tone_hz)
-        self.cue_on_time_spin.setValue(self.params.cue_on_time_ms)
-        self.visual_color_edit.setText(self.params.visual_color_hex)
-        self.visual_radius_spin.setValue(self.params.visual_radius_px)
-        self.notes_edit.clear()
+        # Silence the controls while they are rewritten and refresh the preview once at the end.
+        widgets = [
+            *self.part_spinboxes.values(),
+            self.paradigm_name_edit,
+            self.num_blocks_spin,
+            self.output_folder_edit,
+            self.inter_block_spin,
+            self.cue_type_combo,
+            self.cue_freq_spin,
+            self.cue_tone_spin,
+            self.cue_on_time_spin,
+            self.visual_color_edit,
+            self.visual_radius_spin,
+            self.notes_edit,
+        ]
+        for widget in widgets:
+            widget.blockSignals(True)
+        try:
+            self.paradigm_name_edit.setText("Rhythm")
+            self.num_blocks_spin.setValue(4)
+            self.output_folder_edit.setText(self.params.output_folder)
+            self.inter_block_spin.setValue(30.0)
+            defaults = {
+                "rest_pre": 10.0,
+                "cued_movement": 30.0,
+                "rest_instruction": 5.0,
+                "internal_movement": 30.0,
+                "rest_post": 10.0,
+            }
+            for key, spin in self.part_spinboxes.items():
+                spin.setValue(defaults.get(key, 0.0))
+                self._part_values[key] = float(spin.value())
+            self.cue_type_combo.setCurrentText(self.params.cue_type)
+            self.cue_freq_spin.setValue(self.params.cue_frequency_hz)
+            self.cue_tone_spin.setValue(self.params.cue_tone_hz)
+            self.cue_on_time_spin.setValue(self.params.cue_on_time_ms)
+            self.visual_color_edit.setText(self.params.visual_color_hex)
+            self.visual_radius_spin.setValue(self.params.visual_radius_px)
+            self.notes_edit.clear()
+        finally:
+            for widget in widgets:
+                widget.blockSignals(False)
         self.status_label.setText(tr("status_ready", self.params.language))
+        self.update_timeline_preview()
 
+    @QtCore.pyqtSlot()
     def start_experiment(self) -> None:
         params = self.gather_config()
         error = self.validate_config(params)
@@ -970,21 +1186,26 @@ class MainWindow(QtWidgets.QMainWindow):
         self.set_controls_enabled(False)
         self.current_status_key = "status_running"
         self.status_label.setText(tr(self.current_status_key, params.language))
-        QtWidgets.QApplication.processEvents()
 
         logger = Logger(params)
-        stim_window = StimulusWindow()
-        runner = ParadigmRunner(params, logger, stim_window)
-        runner.run()
-
+        if self.stimulus_window is None:
+            self.stimulus_window = StimulusWindow()
+        self.runner = ParadigmRunner(params, logger, self.stimulus_window)
+        self.runner.paradigm_finished.connect(self.handle_paradigm_finished)
         self.last_logger = logger
         self.last_params = params
-
-        if logger.status.get("stopped_early"):
+        # The runner drives the stimulus window, so it must stay on the GUI thread; queuing it lets
+        # the disabled controls and status text paint before the paradigm starts.
+        QtCore.QTimer.singleShot(0, self.runner.run)
+
+    @QtCore.pyqtSlot(dict)
+    def handle_paradigm_finished(self, status: Dict) -> None:
+        self.runner = None
+        if status.get("stopped_early"):
             self.current_status_key = "status_aborted"
         else:
             self.current_status_key = "status_completed"
-        self.status_label.setText(tr(self.current_status_key, params.language))
+        self.status_label.setText(tr(self.current_status_key, self.params.language))
 
         # NEW: auto-save log and show file path (if not in test mode)
         self.auto_save_log()
@@ -1047,7 +1268,16 @@ class MainWindow(QtWidgets.QMainWindow):
         self.start_button.setEnabled(enabled)
         self.reset_button.setEnabled(enabled)
 
+    def _on_part_duration_changed(self, key: str, value: float) -> None:
+        self._part_values[key] = float(value)
+
+    @QtCore.pyqtSlot()
     def update_timeline_preview(self) -> None:
+        """Schedule a timeline refresh; calls within PREVIEW_DEBOUNCE_MS of each other coalesce."""
+        self._preview_timer.start()
+
+    @QtCore.pyqtSlot()
+    def _refresh_timeline(self) -> None:
         params = self.gather_config(update_only=True)
         self.timeline_widget.set_parameters(params)
 
@@ -0,0 +1,39 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+from core.fileio import save_pickle
+from core.utils import load_pickle
+
+
+class SavePickleRoundTripTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.folder = Path(self._tmp.name)
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def test_numeric_array_dict_uses_npz(self) -> None:
+        path = self.folder / "arrays.pkl"
+        data = {"a": np.arange(5), "b": np.linspace(0.0, 1.0, 3)}
+        save_pickle(data, path)
+        self.assertEqual(path.read_bytes()[:2], b"PK")
+        loaded = load_pickle(path)
+        self.assertEqual(sorted(loaded), ["a", "b"])
+        np.testing.assert_array_equal(loaded["a"], data["a"])
+        np.testing.assert_array_equal(loaded["b"], data["b"])
+
+    def test_object_array_dict_is_pickled(self) -> None:
+        path = self.folder / "objects.pkl"
+        data = {"a": np.array([{"x": 1}, None], dtype=object)}
+        save_pickle(data, path)
+        self.assertNotEqual(path.read_bytes()[:2], b"PK")
+        loaded = load_pickle(path)
+        self.assertEqual(loaded["a"].tolist(), [{"x": 1}, None])
+
+
+if __name__ == "__main__":
+    unittest.main()
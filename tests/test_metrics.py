@@ -0,0 +1,64 @@
+import unittest
+from datetime import datetime
+
+import numpy as np
+
+from core.randomization import generate_trial_schedule
+from gostop.analysis import (
+    OUTCOME_COMMISSION,
+    OUTCOME_CORRECT_WITHHOLDING,
+    OUTCOME_HIT,
+    OUTCOME_MISS,
+    OUTCOME_PENDING,
+    TRIAL_LOG_DTYPE,
+    compute_go_nogo_metrics,
+)
+
+
+def _filled_log() -> np.ndarray:
+    # go hit (0.3 s), go hit (0.5 s), go miss, no-go commission (0.2 s), no-go withheld, unreached slot
+    trials = np.zeros(6, dtype=TRIAL_LOG_DTYPE)
+    trials["trial_index"] = [1, 2, 3, 4, 5, 0]
+    trials["is_go"] = [True, True, True, False, False, True]
+    trials["onset_ns"] = [1_000_000_000, 3_000_000_000, 5_000_000_000, 7_000_000_000, 9_000_000_000, 0]
+    trials["response_ns"] = [1_300_000_000, 3_500_000_000, 0, 7_200_000_000, 0, 0]
+    trials["outcome"] = [
+        OUTCOME_HIT,
+        OUTCOME_HIT,
+        OUTCOME_MISS,
+        OUTCOME_COMMISSION,
+        OUTCOME_CORRECT_WITHHOLDING,
+        OUTCOME_PENDING,
+    ]
+    return trials
+
+
+class GoNoGoMetricsTest(unittest.TestCase):
+    def assert_expected(self, metrics) -> None:
+        self.assertAlmostEqual(metrics["go_hit_percent"], 200 / 3)
+        self.assertAlmostEqual(metrics["nogo_commission_percent"], 50.0)
+        self.assertAlmostEqual(metrics["mean_rt_go_hit"], 0.4)
+        self.assertAlmostEqual(metrics["mean_rt_nogo_commission"], 0.2)
+
+    def test_trial_log_arrays(self) -> None:
+        trials = _filled_log()
+        log = {"timing_relative": {"blocks": {1: {"trials": trials[:3]}, 2: {"trials": trials[3:]}}}}
+        self.assert_expected(compute_go_nogo_metrics(log))
+
+    def test_trial_dicts_match_arrays(self) -> None:
+        from gostop.gui.gui import trial_log_to_dicts
+
+        _, trials_rel = trial_log_to_dicts(_filled_log(), datetime(2024, 1, 1))
+        log = {"timing_relative": {"blocks": {1: {"trials": trials_rel}}}}
+        self.assert_expected(compute_go_nogo_metrics(log))
+
+    def test_schedule_holds_only_digit_and_go_flag(self) -> None:
+        weights = {d: 1.0 for d in range(10)}
+        schedule = generate_trial_schedule(list(range(9)), [9], weights, 0.8, 20)
+        self.assertEqual(schedule.dtype.names, ("digit", "is_go"))
+        self.assertEqual(int(schedule["is_go"].sum()), 16)
+        self.assertTrue(np.all(schedule["digit"][~schedule["is_go"]] == 9))
+
+
+if __name__ == "__main__":
+    unittest.main()